@@ -1,5 +1,7 @@
 """Pulumi entry point for multi-cloud OpenLegislation infrastructure."""
 
+import json
+
 import pulumi
 import pulumi_aws as aws
 import pulumi_digitalocean as do
@@ -10,238 +12,412 @@ from pulumi import export, ResourceOptions
 
 # Import stack-specific configs (e.g., from config.py or env)
 import os
+from pathlib import Path
 
 ENV = os.getenv("ENVIRONMENT", "dev")
 STACK = pulumi.get_stack()
+WORKERS_DIR = Path(__file__).parent / "workers"
 
-# Common resources across clouds (orchestrated here)
-# Example: Deploy app container to AWS ECS, DB to DO, edge to CF, etc.
+# Serialized once at module load and shared by every resource that needs them
+ECS_TASKS_ASSUME_ROLE_POLICY = json.dumps(
+    {
+        "Version": "2012-10-17",
+        "Statement": [
+            {
+                "Sid": "",
+                "Effect": "Allow",
+                "Principal": {"Service": "ecs-tasks.amazonaws.com"},
+                "Action": "sts:AssumeRole",
+            }
+        ],
+    }
+)
+
+
+def _log_config(group, stream_prefix=None):
+    options = {"awslogs-group": group, "awslogs-region": "us-east-1"}
+    if stream_prefix:
+        options["awslogs-stream-prefix"] = stream_prefix
+    return {"logDriver": "awslogs", "options": options}
+
+
+def _container(name, image, port, log_config, environment=None):
+    container = {
+        "name": name,
+        "image": image,
+        "portMappings": [{"containerPort": port}],
+    }
+    if environment:
+        container["environment"] = environment
+    container["logConfiguration"] = log_config
+    return container
+
+
+_MONITORING_LOGS = _log_config("/ecs/monitoring")
 
-# AWS: ECS for app containers
-cluster = aws.ecs.Cluster(
-    f"openleg-{ENV}-cluster",
-    capacity_providers=["FARGATE"],
-    default_capacity_provider_strategy=[
-        aws.ecs.ClusterDefaultCapacityProviderStrategyArgs(
-            capacity_provider="FARGATE", weight=1
+APP_CONTAINER_DEFS = json.dumps(
+    [
+        _container(
+            "openleg-app",
+            "your-repo/openlegislation:latest",  # ECR or public
+            8080,
+            _log_config("/ecs/openleg", stream_prefix="ecs"),
+            environment=[{"name": "ENV", "value": ENV}],
         )
-    ],
+    ]
 )
 
-task_role = aws.iam.Role(
-    f"openleg-{ENV}-task-role",
-    assume_role_policy=json.dumps(
-        {
-            "Version": "2012-10-17",
-            "Statement": [
-                {
-                    "Sid": "",
-                    "Effect": "Allow",
-                    "Principal": {"Service": "ecs-tasks.amazonaws.com"},
-                    "Action": "sts:AssumeRole",
-                }
-            ],
-        }
-    ),
+MONITORING_CONTAINER_DEFS = json.dumps(
+    [
+        _container("prometheus", "prom/prometheus:latest", 9090, _MONITORING_LOGS),
+        _container(
+            "grafana",
+            "grafana/grafana:latest",
+            3000,
+            _MONITORING_LOGS,
+            environment=[{"name": "GF_SECURITY_ADMIN_PASSWORD", "value": "admin"}],
+        ),
+    ]
 )
 
-task_exec_role = aws.iam.Role(
-    f"openleg-{ENV}-task-exec-role",
-    assume_role_policy=json.dumps(
-        {
-            "Version": "2012-10-17",
-            "Statement": [
-                {
-                    "Sid": "",
-                    "Effect": "Allow",
-                    "Principal": {"Service": "ecs-tasks.amazonaws.com"},
-                    "Action": "sts:AssumeRole",
-                }
-            ],
-        }
-    ),
+# AWS network lookups: the networking comes from infra/terraform/aws. Each
+# lookup is issued once here and its ids are shared by every service, rather
+# than one Describe* round-trip per resource that needs them.
+VPC = aws.ec2.get_vpc(tags={"Name": f"{ENV}-openlegislation-vpc"})
+
+PUBLIC_SUBNETS = aws.ec2.get_subnets(
+    filters=[
+        aws.ec2.GetSubnetsFilterArgs(name="tag:Environment", values=[ENV]),
+        aws.ec2.GetSubnetsFilterArgs(name="tag:Name", values=[f"{ENV}-public-subnet-*"]),
+    ]
 )
 
-aws.iam.RolePolicyAttachment(
-    f"openleg-{ENV}-task-exec",
-    role=task_exec_role.name,
-    policy_arn="arn:aws:iam::aws:policy/service-role/AmazonECSTaskExecutionRolePolicy",
+APP_SECURITY_GROUPS = aws.ec2.get_security_groups(
+    filters=[
+        aws.ec2.GetSecurityGroupsFilterArgs(name="tag:Environment", values=[ENV]),
+        aws.ec2.GetSecurityGroupsFilterArgs(name="tag:Name", values=[f"{ENV}-app-sg"]),
+    ]
 )
 
-task_def = aws.ecs.TaskDefinition(
-    f"openleg-{ENV}-task",
-    family="openleg-app",
-    cpu="256",
-    memory="512",
-    network_mode="awsvpc",
-    requires_compatibilities=["FARGATE"],
-    execution_role_arn=task_exec_role.arn,
-    task_role_arn=task_role.arn,
-    container_definitions=json.dumps(
-        [
+# Common resources across clouds (orchestrated here)
+# Example: Deploy app container to AWS ECS, DB to DO, edge to CF, etc.
+#
+# Each cloud's resources live under their own ComponentResource so the engine
+# sees independent subgraphs and can provision them concurrently. Only real
+# cross-cloud edges (e.g. Cloudflare DNS -> AWS endpoint) are passed in as
+# inputs. Run with `pulumi up --parallel N` (see infra/scripts/apply.sh).
+
+
+class _CloudStack(pulumi.ComponentResource):
+    """Base component for one cloud's resources."""
+
+    def __init__(self, type_name, name, opts=None):
+        super().__init__(f"openleg:index:{type_name}", name, {}, opts)
+
+    def child_opts(self, **kwargs):
+        # Alias to the stack root so resources created before the components
+        # existed are adopted in place rather than replaced.
+        return ResourceOptions(
+            parent=self,
+            aliases=[pulumi.Alias(parent=pulumi.ROOT_STACK_RESOURCE)],
+            **kwargs,
+        )
+
+
+class AwsStack(_CloudStack):
+    """ECS cluster running the app behind an ALB, plus the monitoring services."""
+
+    def __init__(self, name, opts=None):
+        super().__init__("AwsStack", name, opts)
+
+        # AWS: ECS for app containers
+        self.cluster = aws.ecs.Cluster(
+            f"openleg-{ENV}-cluster",
+            capacity_providers=["FARGATE"],
+            default_capacity_provider_strategy=[
+                aws.ecs.ClusterDefaultCapacityProviderStrategyArgs(
+                    capacity_provider="FARGATE", weight=1
+                )
+            ],
+            opts=self.child_opts(),
+        )
+
+        self.task_role = aws.iam.Role(
+            f"openleg-{ENV}-task-role",
+            assume_role_policy=ECS_TASKS_ASSUME_ROLE_POLICY,
+            opts=self.child_opts(),
+        )
+
+        self.task_exec_role = aws.iam.Role(
+            f"openleg-{ENV}-task-exec-role",
+            assume_role_policy=ECS_TASKS_ASSUME_ROLE_POLICY,
+            opts=self.child_opts(),
+        )
+
+        aws.iam.RolePolicyAttachment(
+            f"openleg-{ENV}-task-exec",
+            role=self.task_exec_role.name,
+            policy_arn="arn:aws:iam::aws:policy/service-role/AmazonECSTaskExecutionRolePolicy",
+            opts=self.child_opts(),
+        )
+
+        self.task_def = aws.ecs.TaskDefinition(
+            f"openleg-{ENV}-task",
+            family="openleg-app",
+            cpu="256",
+            memory="512",
+            network_mode="awsvpc",
+            requires_compatibilities=["FARGATE"],
+            execution_role_arn=self.task_exec_role.arn,
+            task_role_arn=self.task_role.arn,
+            container_definitions=APP_CONTAINER_DEFS,
+            opts=self.child_opts(),
+        )
+
+        # Public ALB in front of the app; its DNS name is the Cloudflare origin
+        self.alb_sg = aws.ec2.SecurityGroup(
+            f"openleg-{ENV}-alb-sg",
+            vpc_id=VPC.id,
+            ingress=[
+                aws.ec2.SecurityGroupIngressArgs(
+                    protocol="tcp", from_port=80, to_port=80, cidr_blocks=["0.0.0.0/0"]
+                )
+            ],
+            egress=[
+                aws.ec2.SecurityGroupEgressArgs(
+                    protocol="-1", from_port=0, to_port=0, cidr_blocks=["0.0.0.0/0"]
+                )
+            ],
+            opts=self.child_opts(),
+        )
+
+        self.alb = aws.lb.LoadBalancer(
+            f"openleg-{ENV}-alb",
+            load_balancer_type="application",
+            subnets=PUBLIC_SUBNETS.ids,
+            security_groups=[self.alb_sg.id],
+            opts=self.child_opts(),
+        )
+
+        self.target_group = aws.lb.TargetGroup(
+            f"openleg-{ENV}-tg",
+            port=8080,
+            protocol="HTTP",
+            target_type="ip",
+            vpc_id=VPC.id,
+            opts=self.child_opts(),
+        )
+
+        self.listener = aws.lb.Listener(
+            f"openleg-{ENV}-listener",
+            load_balancer_arn=self.alb.arn,
+            port=80,
+            default_actions=[
+                aws.lb.ListenerDefaultActionArgs(
+                    type="forward", target_group_arn=self.target_group.arn
+                )
+            ],
+            opts=self.child_opts(),
+        )
+
+        # The task definition dependency is inferred from task_definition=; the
+        # listener is explicit because ECS rejects a target group with no LB.
+        self.service = aws.ecs.Service(
+            f"openleg-{ENV}-service",
+            name="openleg-service",
+            cluster=self.cluster.arn,
+            task_definition=self.task_def.arn,
+            desired_count=1,
+            launch_type="FARGATE",
+            network_configuration=aws.ecs.ServiceNetworkConfigurationArgs(
+                subnets=PUBLIC_SUBNETS.ids,
+                security_groups=APP_SECURITY_GROUPS.ids,
+                assign_public_ip=True,
+            ),
+            load_balancers=[
+                aws.ecs.ServiceLoadBalancerArgs(
+                    target_group_arn=self.target_group.arn,
+                    container_name="openleg-app",
+                    container_port=8080,
+                )
+            ],
+            opts=self.child_opts(depends_on=[self.listener]),
+        )
+
+        # Monitoring: Prometheus/Grafana on AWS ECS (simple)
+        self.prom_task = aws.ecs.TaskDefinition(
+            f"openleg-{ENV}-prom",
+            family="monitoring",
+            cpu="256",
+            memory="512",
+            network_mode="awsvpc",
+            requires_compatibilities=["FARGATE"],
+            execution_role_arn=self.task_exec_role.arn,
+            container_definitions=MONITORING_CONTAINER_DEFS,
+            opts=self.child_opts(),
+        )
+
+        self.prom_service = aws.ecs.Service(
+            f"openleg-{ENV}-monitoring",
+            cluster=self.cluster.arn,
+            task_definition=self.prom_task.arn,
+            desired_count=1,
+            launch_type="FARGATE",
+            network_configuration=aws.ecs.ServiceNetworkConfigurationArgs(
+                subnets=PUBLIC_SUBNETS.ids,
+                security_groups=["sg-monitoring"],  # Not managed by TF yet
+                assign_public_ip=True,
+            ),
+            opts=self.child_opts(),
+        )
+
+        self.register_outputs(
             {
-                "name": "openleg-app",
-                "image": "your-repo/openlegislation:latest",  # ECR or public
-                "portMappings": [{"containerPort": 8080}],
-                "environment": [{"name": "ENV", "value": ENV}],
-                "logConfiguration": {
-                    "logDriver": "awslogs",
-                    "options": {
-                        "awslogs-group": "/ecs/openleg",
-                        "awslogs-region": "us-east-1",
-                        "awslogs-stream-prefix": "ecs",
-                    },
-                },
+                "cluster_arn": self.cluster.arn,
+                "alb_dns_name": self.alb.dns_name,
+                "monitoring_service_arn": self.prom_service.arn,
             }
-        ]
-    ),
-)
+        )
 
-service = aws.ecs.Service(
-    f"openleg-{ENV}-service",
-    name="openleg-service",
-    cluster=cluster.arn,
-    task_definition=task_def.arn,
-    desired_count=1,
-    launch_type="FARGATE",
-    network_configuration=aws.ecs.ServiceNetworkConfigurationArgs(
-        subnets=["subnet-12345678"],  # From TF or data source
-        security_groups=["sg-12345678"],
-        assign_public_ip=True,
-    ),
-    opts=ResourceOptions(depends_on=[task_def]),
-)
 
-# DigitalOcean: Managed DB
-do_db = do.DatabaseCluster(
-    f"openleg-{ENV}-db",
-    engine="pg",
-    version="15",
-    size="db-s-1vcpu-1gb",
-    region="nyc3",
-    node_count=1 if ENV == "dev" else 3,
-    tags=[ENV],
-)
+class DoStack(_CloudStack):
+    """DigitalOcean managed Postgres."""
+
+    def __init__(self, name, opts=None):
+        super().__init__("DoStack", name, opts)
+
+        # DigitalOcean: Managed DB
+        self.db = do.DatabaseCluster(
+            f"openleg-{ENV}-db",
+            engine="pg",
+            version="15",
+            size="db-s-1vcpu-1gb",
+            region="nyc3",
+            node_count=1 if ENV == "dev" else 3,
+            tags=[ENV],
+            opts=self.child_opts(),
+        )
+
+        self.register_outputs({"db_host": self.db.host})
+
 
-# Hetzner: Storage server
-hcloud_server = hcloud.Server(
-    f"openleg-{ENV}-storage",
-    name=f"storage-{ENV}",
-    image="ubuntu-22.04",
-    server_type="cx22",
-    location="fsn1",
-    ssh_keys=[hcloud.SshKey("default").id],
-    user_data="""#!/bin/bash
+class HetznerStack(_CloudStack):
+    """Hetzner storage server."""
+
+    def __init__(self, name, opts=None):
+        super().__init__("HetznerStack", name, opts)
+
+        # Hetzner: Storage server
+        self.ssh_key = hcloud.SshKey("default", opts=self.child_opts())
+        self.server = hcloud.Server(
+            f"openleg-{ENV}-storage",
+            name=f"storage-{ENV}",
+            image="ubuntu-22.04",
+            server_type="cx22",
+            location="fsn1",
+            ssh_keys=[self.ssh_key.id],
+            user_data="""#!/bin/bash
 apt update
 apt install -y docker.io
 docker run -d -p 8080:8080 --name storage-app your-image:latest
 """,
-    labels={"environment": ENV},
-)
+            labels={"environment": ENV},
+            opts=self.child_opts(),
+        )
 
-# Cloudflare: DNS and Worker
-cf_zone = cloudflare.Zone(
-    f"openleg-{ENV}-zone", zone="openlegislation.com", type="full"  # Var
-)
+        self.register_outputs({"server_ip": self.server.ipv4_address})
 
-cf_record = cloudflare.Record(
-    f"openleg-{ENV}-a",
-    zone_id=cf_zone.id,
-    name="app",
-    value=service.load_balancers[0].dns_name,  # From AWS ALB
-    type="A",
-    proxied=True,
-)
 
-cf_worker = cloudflare.WorkerScript(
-    f"openleg-{ENV}-worker",
-    name="api-worker",
-    content="addEventListener('fetch', event => { event.respondWith(handleRequest(event.request)) }) async function handleRequest(request) { return new Response('Hello from edge!') }",
-)
+class CfStack(_CloudStack):
+    """Cloudflare DNS and edge Worker in front of the app origin."""
 
-cf_route = cloudflare.WorkerRoute(
-    f"openleg-{ENV}-route",
-    zone_id=cf_zone.id,
-    pattern="api.*.openlegislation.com/*",
-    script_name=cf_worker.name,
-)
+    def __init__(self, name, app_origin, opts=None):
+        super().__init__("CfStack", name, opts)
 
-# GCP: AI/ML endpoint (Vertex AI)
-gcp_endpoint = gcp.vertex.AiEndpoint(
-    f"openleg-{ENV}-endpoint",
-    name=f"bill-analysis-{ENV}",
-    region="us-central1",
-    deployed_models=[
-        gcp.vertex.AiEndpointDeployedModelArgs(
-            model=gcp.vertex.AiModel("gemini-model").id,
-            display_name="gemini-deployment",
-            machine_type="n1-standard-4",
-        )
-    ],
-)
+        # Outputs such as app_origin and zone.id are passed straight through as
+        # inputs: the engine waits on all of a resource's inputs together, and
+        # resources created inside Output.all(...).apply() would be invisible
+        # to `pulumi preview`.
+
+        # Cloudflare: DNS and Worker
+        self.zone = cloudflare.Zone(
+            f"openleg-{ENV}-zone",
+            zone="openlegislation.com",  # Var
+            type="full",
+            opts=self.child_opts(),
+        )
+
+        self.record = cloudflare.Record(
+            f"openleg-{ENV}-a",
+            zone_id=self.zone.id,
+            name="app",
+            value=app_origin,
+            type="CNAME",
+            proxied=True,
+            opts=self.child_opts(),
+        )
+
+        self.worker = cloudflare.WorkerScript(
+            f"openleg-{ENV}-worker",
+            name="api-worker",
+            # WorkerScript takes a string, not an Asset; read it from disk
+            content=(WORKERS_DIR / "api_worker.js").read_text(),
+            opts=self.child_opts(),
+        )
+
+        self.route = cloudflare.WorkerRoute(
+            f"openleg-{ENV}-route",
+            zone_id=self.zone.id,
+            pattern="api.*.openlegislation.com/*",
+            script_name=self.worker.name,
+            opts=self.child_opts(),
+        )
+
+        self.register_outputs({"zone_id": self.zone.id})
+
+
+class GcpStack(_CloudStack):
+    """Vertex AI endpoint for bill analysis."""
+
+    def __init__(self, name, opts=None):
+        super().__init__("GcpStack", name, opts)
+
+        # GCP: AI/ML endpoint (Vertex AI)
+        self.model = gcp.vertex.AiModel("gemini-model", opts=self.child_opts())
+        self.endpoint = gcp.vertex.AiEndpoint(
+            f"openleg-{ENV}-endpoint",
+            name=f"bill-analysis-{ENV}",
+            region="us-central1",
+            deployed_models=[
+                gcp.vertex.AiEndpointDeployedModelArgs(
+                    model=self.model.id,
+                    display_name="gemini-deployment",
+                    machine_type="n1-standard-4",
+                )
+            ],
+            opts=self.child_opts(),
+        )
+
+        self.register_outputs({"endpoint_name": self.endpoint.name})
 
-# Monitoring: Prometheus/Grafana on AWS ECS (simple)
-prom_task = aws.ecs.TaskDefinition(
-    f"openleg-{ENV}-prom",
-    family="monitoring",
-    cpu="256",
-    memory="512",
-    network_mode="awsvpc",
-    requires_compatibilities=["FARGATE"],
-    execution_role_arn=task_exec_role.arn,
-    container_definitions=json.dumps(
-        [
-            {
-                "name": "prometheus",
-                "image": "prom/prometheus:latest",
-                "portMappings": [{"containerPort": 9090}],
-                "logConfiguration": {
-                    "logDriver": "awslogs",
-                    "options": {
-                        "awslogs-group": "/ecs/monitoring",
-                        "awslogs-region": "us-east-1",
-                    },
-                },
-            },
-            {
-                "name": "grafana",
-                "image": "grafana/grafana:latest",
-                "portMappings": [{"containerPort": 3000}],
-                "environment": [
-                    {"name": "GF_SECURITY_ADMIN_PASSWORD", "value": "admin"}
-                ],
-                "logConfiguration": {
-                    "logDriver": "awslogs",
-                    "options": {
-                        "awslogs-group": "/ecs/monitoring",
-                        "awslogs-region": "us-east-1",
-                    },
-                },
-            },
-        ]
-    ),
-)
 
-prom_service = aws.ecs.Service(
-    f"openleg-{ENV}-monitoring",
-    cluster=cluster.arn,
-    task_definition=prom_task.arn,
-    desired_count=1,
-    launch_type="FARGATE",
-    network_configuration=aws.ecs.ServiceNetworkConfigurationArgs(
-        subnets=["subnet-12345678"],
-        security_groups=["sg-monitoring"],
-        assign_public_ip=True,
-    ),
+aws_stack = AwsStack(f"openleg-{ENV}-aws")
+do_stack = DoStack(f"openleg-{ENV}-do")
+hetzner_stack = HetznerStack(f"openleg-{ENV}-hetzner")
+cf_stack = CfStack(
+    f"openleg-{ENV}-cf",
+    app_origin=aws_stack.alb.dns_name,
 )
+gcp_stack = GcpStack(f"openleg-{ENV}-gcp")
 
 # CI/CD: GitHub Actions workflow (Pulumi outputs for integration)
 # Note: Workflow file in .github/workflows/deploy.yml (create separately)
 
 # Exports
-export("aws_cluster_arn", cluster.arn)
-export("do_db_host", do_db.host)
-export("hcloud_server_ip", hcloud_server.ipv4_address)
-export("cf_zone_id", cf_zone.id)
-export("gcp_endpoint_name", gcp_endpoint.name)
-export("monitoring_service_arn", prom_service.arn)
+export("aws_cluster_arn", aws_stack.cluster.arn)
+export("aws_alb_dns_name", aws_stack.alb.dns_name)
+export("do_db_host", do_stack.db.host)
+export("hcloud_server_ip", hetzner_stack.server.ipv4_address)
+export("cf_zone_id", cf_stack.zone.id)
+export("gcp_endpoint_name", gcp_stack.endpoint.name)
+export("monitoring_service_arn", aws_stack.prom_service.arn)
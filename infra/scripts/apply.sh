@@ -3,11 +3,13 @@
 # Deployment script for multi-cloud infrastructure
 # Usage: ./apply.sh [--dry-run] [--env dev|prod] [--provider all|aws|hetzner|cf|do]
 # Env vars: Same as init.sh + TF_VAR_db_password etc. for secrets
+#           PULUMI_PARALLEL (default 32) bounds concurrent Pulumi resource operations
 
 set -e  # Exit on error
 
 DRY_RUN=false
 ENV="dev"
+PULUMI_PARALLEL="${PULUMI_PARALLEL:-32}"
 PROVIDER="all"
 
 while [[ $# -gt 0 ]]; do
@@ -76,9 +78,9 @@ done
 echo "=== Pulumi Deploy ($ENV) ==="
 cd infra/pulumi
 if [ "$DRY_RUN" = true ]; then
-  pulumi preview --stack "$ENV"
+  pulumi preview --stack "$ENV" --parallel "$PULUMI_PARALLEL"
 else
-  pulumi up --stack "$ENV" --yes
+  pulumi up --stack "$ENV" --yes --parallel "$PULUMI_PARALLEL"
 fi
 cd -
 
@@ -1,12 +1,12 @@
-from pydantic import BaseModel
 from typing import Dict, List, Optional, Set
-from datetime import date, datetime
-from collections import OrderedDict
-import uuid
+from datetime import date
+from functools import reduce
+from operator import xor
+
+from pydantic import Field
 
 from .agenda_id import AgendaId
 from .base_legislative_content import BaseLegislativeContent
-from .session_year import SessionYear
 from .committee_id import CommitteeId
 from .version import Version
 from .agenda_info_addendum import AgendaInfoAddendum
@@ -14,17 +14,11 @@ from .agenda_vote_addendum import AgendaVoteAddendum
 from .committee_agenda_addendum_id import CommitteeAgendaAddendumId
 from .agenda_vote_committee import AgendaVoteCommittee
 
+
 class Agenda(BaseLegislativeContent):
     id: Optional[AgendaId] = None
-    agenda_info_addenda: Dict[str, AgendaInfoAddendum] = {}
-    agenda_vote_addenda: Dict[str, AgendaVoteAddendum] = {}
-
-    def __init__(self, **data):
-        super().__init__(**data)
-        if not self.agenda_info_addenda:
-            self.agenda_info_addenda = OrderedDict()
-        if not self.agenda_vote_addenda:
-            self.agenda_vote_addenda = OrderedDict()
+    agenda_info_addenda: Dict[str, AgendaInfoAddendum] = Field(default_factory=dict)
+    agenda_vote_addenda: Dict[str, AgendaVoteAddendum] = Field(default_factory=dict)
 
     def __str__(self):
         return f"Agenda {self.id}"
@@ -38,9 +32,15 @@ class Agenda(BaseLegislativeContent):
                 self.agenda_vote_addenda == other.agenda_vote_addenda and
                 self.published_date_time == other.published_date_time)
 
+    # Not memoized: the addenda (and their committees) are mutated in place and
+    # cannot reach back to reset a cached value here.
     def __hash__(self):
-        return hash((self.year, self.id, tuple(sorted(self.agenda_info_addenda.items())),
-                    tuple(sorted(self.agenda_vote_addenda.items())), self.published_date_time))
+        # XOR over entry hashes is order independent, like dict equality, and
+        # needs no sort (so no ordering on the addendum values)
+        return hash((self.year, self.id,
+                     reduce(xor, map(hash, self.agenda_info_addenda.items()), 0),
+                     reduce(xor, map(hash, self.agenda_vote_addenda.items()), 0),
+                     self.published_date_time))
 
     # Functional Getters/Setters
     def get_agenda_info_addendum(self, addendum_id: str) -> Optional[AgendaInfoAddendum]:
@@ -56,33 +56,45 @@ class Agenda(BaseLegislativeContent):
         self.agenda_vote_addenda[addendum.get_id()] = addendum
 
     def get_week_of(self) -> Optional[date]:
-        return next((addendum.get_week_of() for addendum in self.agenda_info_addenda.values()
-                    if addendum.get_week_of() is not None), None)
+        return next((addendum.week_of for addendum in self.agenda_info_addenda.values()
+                    if addendum.week_of is not None), None)
 
+    # Each total walks only the addenda it reads, on every call. Not cached: addenda
+    # and their committees are mutated in place after they are attached, and those
+    # changes never reach the Agenda.
     def total_bills_considered(self, committee_id: Optional[CommitteeId] = None) -> int:
-        return sum(
-            len(ic.get_items()) for ia in self.agenda_info_addenda.values()
-            for ic in (ia.get_committee_info_map().values() if committee_id is None
-                      else [ia.get_committee_info_map().get(committee_id)] if ia.get_committee_info_map().get(committee_id) else [])
-        )
+        if committee_id is None:
+            return sum(len(ic.items) for ia in self.agenda_info_addenda.values()
+                       for ic in ia.committee_info_map.values())
+        total = 0
+        for ia in self.agenda_info_addenda.values():
+            ic = ia.committee_info_map.get(committee_id)
+            if ic is not None:
+                total += len(ic.items)
+        return total
 
     def total_bills_voted(self, committee_id: Optional[CommitteeId] = None) -> int:
-        return sum(
-            len(ic.get_voted_bills()) for ia in self.agenda_vote_addenda.values()
-            for ic in (ia.get_committee_vote_map().values() if committee_id is None
-                      else [ia.get_committee_vote_map().get(committee_id)] if ia.get_committee_vote_map().get(committee_id) else [])
-        )
+        if committee_id is None:
+            return sum(len(vc.voted_bills) for va in self.agenda_vote_addenda.values()
+                       for vc in va.committee_vote_map.values())
+        total = 0
+        for va in self.agenda_vote_addenda.values():
+            vc = va.committee_vote_map.get(committee_id)
+            if vc is not None:
+                total += len(vc.voted_bills)
+        return total
 
     def total_committees(self) -> int:
-        return len({committee_id for ia in self.agenda_info_addenda.values()
-                   for committee_id in ia.get_committee_info_map().keys()})
+        return len(self.get_committees())
 
     def has_committee(self, committee_id: CommitteeId) -> bool:
-        return any(committee_id in ia.get_committee_info_map() for ia in self.agenda_info_addenda.values())
+        return any(committee_id in ia.committee_info_map for ia in self.agenda_info_addenda.values())
 
     def get_committees(self) -> Set[CommitteeId]:
-        return {committee_id for ia in self.agenda_info_addenda.values()
-               for committee_id in ia.get_committee_info_map().keys()}
+        committees = set()
+        for ia in self.agenda_info_addenda.values():
+            committees.update(ia.committee_info_map)
+        return committees
 
     def get_addenda(self) -> Set[str]:
         return set(self.agenda_info_addenda.keys()) | set(self.agenda_vote_addenda.keys())
@@ -108,30 +120,31 @@ class Agenda(BaseLegislativeContent):
         self.agenda_vote_addenda = agenda_vote_addenda
 
     # Functional Getters
+    # Built on each call, like the totals above: the addenda behind them change in place.
     def get_committee_agenda_addendum_ids(self) -> List[CommitteeAgendaAddendumId]:
         return [
             CommitteeAgendaAddendumId(
-                agenda_info_committee.get_agenda_id(),
-                agenda_info_committee.get_committee_id(),
-                agenda_info_committee.get_addendum()
+                agenda_info_committee.agenda_id,
+                agenda_info_committee.committee_id,
+                agenda_info_committee.addendum
             )
             for agenda_info_addendum in self.agenda_info_addenda.values()
-            for agenda_info_committee in agenda_info_addendum.get_committee_info_map().values()
+            for agenda_info_committee in agenda_info_addendum.committee_info_map.values()
         ]
 
     def get_votes(self) -> Dict[CommitteeAgendaAddendumId, AgendaVoteCommittee]:
         votes = {}
+        agenda_id = self.id
         for addendum in self.agenda_vote_addenda.values():
-            for vote_comm in addendum.get_committee_vote_map().values():
-                vote_id = CommitteeAgendaAddendumId(
-                    self.id, vote_comm.get_committee_id(), Version.of(addendum.get_id())
-                )
-                votes[vote_id] = vote_comm
+            # Parsed once per addendum rather than once per committee.
+            version = Version.of(addendum.id)
+            for vote_comm in addendum.committee_vote_map.values():
+                votes[CommitteeAgendaAddendumId(agenda_id, vote_comm.committee_id, version)] = vote_comm
         return votes
 
     def get_votes_for_committee(self, committee_id: CommitteeId) -> List[AgendaVoteCommittee]:
         return [
             vote_comm for addendum in self.agenda_vote_addenda.values()
-            for vote_comm in [addendum.get_committee_vote_map().get(committee_id)]
+            for vote_comm in [addendum.committee_vote_map.get(committee_id)]
             if vote_comm is not None
-        ]
\ No newline at end of file
+        ]
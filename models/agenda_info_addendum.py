@@ -1,23 +1,20 @@
-from pydantic import BaseModel
+from pydantic import Field
 from typing import Dict, Optional
 from datetime import date, datetime
+from functools import reduce
+from operator import xor
 
 from .agenda_id import AgendaId
 from .base_legislative_content import BaseLegislativeContent
 from .session_year import SessionYear
-from .committee_id import CommitteeId
+from .committee_id import CommitteeId, CommitteeIdKey
 from .agenda_info_committee import AgendaInfoCommittee
 
 class AgendaInfoAddendum(BaseLegislativeContent):
     agenda_id: Optional[AgendaId] = None
     id: Optional[str] = None
     week_of: Optional[date] = None
-    committee_info_map: Dict[CommitteeId, AgendaInfoCommittee] = {}
-
-    def __init__(self, **data):
-        super().__init__(**data)
-        if not self.committee_info_map:
-            self.committee_info_map = {}
+    committee_info_map: Dict[CommitteeIdKey, AgendaInfoCommittee] = Field(default_factory=dict)
 
     # Functional Getters/Setters
     def put_committee(self, info_committee: AgendaInfoCommittee):
@@ -39,8 +36,9 @@ class AgendaInfoAddendum(BaseLegislativeContent):
                 self.committee_info_map == other.committee_info_map)
 
     def __hash__(self):
+        # Not memoized: AgendaInfoCommittee items are appended in place.
         return hash((self.year, self.agenda_id, self.id, self.week_of,
-                    tuple(sorted(self.committee_info_map.items()))))
+                     reduce(xor, map(hash, self.committee_info_map.items()), 0)))
 
     # Basic Getters/Setters
     def get_agenda_id(self) -> Optional[AgendaId]:
@@ -67,4 +65,4 @@ class AgendaInfoAddendum(BaseLegislativeContent):
         return self.committee_info_map
 
     def set_committee_info_map(self, committee_info_map: Dict[CommitteeId, AgendaInfoCommittee]):
-        self.committee_info_map = committee_info_map
\ No newline at end of file
+        self.committee_info_map = committee_info_map
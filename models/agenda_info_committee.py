@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import List, Optional
 from datetime import datetime
 
@@ -15,7 +15,7 @@ class AgendaInfoCommittee(BaseModel):
     location: Optional[str] = None
     meeting_date_time: Optional[datetime] = None
     notes: Optional[str] = None
-    items: List[AgendaInfoCommitteeItem] = []
+    items: List[AgendaInfoCommitteeItem] = Field(default_factory=list)
 
     # Functional Getters/Setters
     def add_committee_item(self, item: AgendaInfoCommitteeItem):
@@ -85,4 +85,4 @@ class AgendaInfoCommittee(BaseModel):
         return self.items
 
     def set_items(self, items: List[AgendaInfoCommitteeItem]):
-        self.items = items
\ No newline at end of file
+        self.items = items
@@ -1,7 +1,7 @@
 from enum import Enum
 from typing import Dict, Optional
 
-class AgendaVoteAction(Enum):
+class AgendaVoteAction(str, Enum):
     REPORTED = "R"
     FIRST_READING = "F"
     THIRD_READING = "3"
@@ -10,19 +10,15 @@ class AgendaVoteAction(Enum):
     RESTORED_TO_THIRD = "R3"
     SPECIAL = "S"
 
-    def __init__(self, code: str):
-        self.code = code
-
     @property
     def get_code(self) -> str:
-        return self.code
+        return self.value
 
     @staticmethod
     def value_of_code(code: Optional[str]) -> Optional['AgendaVoteAction']:
         if code is None:
             raise ValueError("Supplied code cannot be null when mapping to AgendaVoteAction.")
-        code_upper = code.strip().upper()
-        for action in AgendaVoteAction:
-            if action.code == code_upper:
-                return action
-        return None
\ No newline at end of file
+        return _ACTIONS_BY_CODE.get(code.strip().upper())
+
+
+_ACTIONS_BY_CODE: Dict[str, AgendaVoteAction] = {action.value: action for action in AgendaVoteAction}
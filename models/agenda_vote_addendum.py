@@ -1,22 +1,19 @@
-from pydantic import BaseModel
+from pydantic import Field
 from typing import Dict, Optional
 from datetime import datetime
+from functools import reduce
+from operator import xor
 
 from .agenda_id import AgendaId
 from .base_legislative_content import BaseLegislativeContent
 from .session_year import SessionYear
-from .committee_id import CommitteeId
+from .committee_id import CommitteeId, CommitteeIdKey
 from .agenda_vote_committee import AgendaVoteCommittee
 
 class AgendaVoteAddendum(BaseLegislativeContent):
     agenda_id: Optional[AgendaId] = None
     id: Optional[str] = None
-    committee_vote_map: Dict[CommitteeId, AgendaVoteCommittee] = {}
-
-    def __init__(self, **data):
-        super().__init__(**data)
-        if not self.committee_vote_map:
-            self.committee_vote_map = {}
+    committee_vote_map: Dict[CommitteeIdKey, AgendaVoteCommittee] = Field(default_factory=dict)
 
     # Functional Getters/Setters
     def get_committee(self, committee_id: CommitteeId) -> Optional[AgendaVoteCommittee]:
@@ -36,7 +33,10 @@ class AgendaVoteAddendum(BaseLegislativeContent):
                 self.committee_vote_map == other.committee_vote_map)
 
     def __hash__(self):
-        return hash((self.agenda_id, self.id, tuple(sorted(self.committee_vote_map.items()))))
+        # Not memoized: committees are mutated in place. XOR over the entry hashes is
+        # order independent like dict equality, and is recomputed on every call.
+        return hash((self.agenda_id, self.id,
+                     reduce(xor, map(hash, self.committee_vote_map.items()), 0)))
 
     # Basic Getters/Setters
     def get_agenda_id(self) -> Optional[AgendaId]:
@@ -55,4 +55,4 @@ class AgendaVoteAddendum(BaseLegislativeContent):
         return self.committee_vote_map
 
     def set_committee_vote_map(self, committee_vote_map: Dict[CommitteeId, AgendaVoteCommittee]):
-        self.committee_vote_map = committee_vote_map
\ No newline at end of file
+        self.committee_vote_map = committee_vote_map
@@ -1,9 +1,11 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Dict, List, Optional
 from datetime import datetime
+from functools import reduce
+from operator import xor
 
 from .committee_id import CommitteeId
-from .bill_id import BillId
+from .bill_id import BillId, BillIdKey
 from .agenda_vote_attendance import AgendaVoteAttendance
 from .agenda_vote_bill import AgendaVoteBill
 
@@ -11,24 +13,23 @@ class AgendaVoteCommittee(BaseModel):
     committee_id: Optional[CommitteeId] = None
     chair: Optional[str] = None
     meeting_date_time: Optional[datetime] = None
-    attendance: List[AgendaVoteAttendance] = []
-    voted_bills: Dict[BillId, AgendaVoteBill] = {}
+    attendance: List[AgendaVoteAttendance] = Field(default_factory=list)
+    voted_bills: Dict[BillIdKey, AgendaVoteBill] = Field(default_factory=dict)
 
-    def __init__(self, **data):
-        super().__init__(**data)
-        if not self.attendance:
-            self.attendance = []
-        if not self.voted_bills:
-            self.voted_bills = {}
+    @classmethod
+    def from_trusted(cls, data: dict) -> 'AgendaVoteCommittee':
+        """Builds an instance from already-validated data (e.g. a DB row) without
+        running pydantic validation. Callers must pass correctly typed values."""
+        return cls.model_construct(**data)
 
     # Functional Getters/Setters
-    def add_vote_bill(self, agenda_vote_bill: AgendaVoteBill):
+    def add_vote_bill(self, agenda_vote_bill: AgendaVoteBill) -> None:
         self.voted_bills[agenda_vote_bill.get_bill_id()] = agenda_vote_bill
 
-    def remove_vote_bill(self, bill_id: BillId):
+    def remove_vote_bill(self, bill_id: BillId) -> None:
         self.voted_bills.pop(bill_id, None)
 
-    def __eq__(self, other):
+    def __eq__(self, other: object) -> bool:
         if not isinstance(other, AgendaVoteCommittee):
             return False
         return (self.committee_id == other.committee_id and
@@ -37,9 +38,11 @@ class AgendaVoteCommittee(BaseModel):
                 self.attendance == other.attendance and
                 self.voted_bills == other.voted_bills)
 
-    def __hash__(self):
+    def __hash__(self) -> int:
+        # XOR of the item hashes is order-independent, so the voted bills need no sort.
         return hash((self.committee_id, self.chair, self.meeting_date_time,
-                    tuple(self.attendance), tuple(sorted(self.voted_bills.items()))))
+                     tuple(self.attendance),
+                     reduce(xor, map(hash, self.voted_bills.items()), 0)))
 
     def __str__(self):
         return f"{self.committee_id} meetingDateTime: {self.meeting_date_time}"
@@ -76,4 +79,4 @@ class AgendaVoteCommittee(BaseModel):
         self.attendance = attendance
 
     def add_attendance(self, attendance: AgendaVoteAttendance):
-        self.attendance.append(attendance)
\ No newline at end of file
+        self.attendance.append(attendance)
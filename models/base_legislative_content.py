@@ -1,21 +1,34 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, model_validator
+from pydantic_core import to_json
 from typing import Optional
 from datetime import datetime
 
 from .session_year import SessionYear
 
 class BaseLegislativeContent(BaseModel):
+    model_config = ConfigDict(extra='forbid')
+
     session: Optional[SessionYear] = None
     year: int = 0
     modified_date_time: Optional[datetime] = None
     published_date_time: Optional[datetime] = None
 
-    def __init__(self, **data):
-        super().__init__(**data)
+    @model_validator(mode='after')
+    def _derive_session(self):
         if self.year and not self.session:
             self.session = SessionYear.of(self.year)
+        return self
+
+    @classmethod
+    def from_trusted(cls, data: dict):
+        """Builds an instance from already-validated data (e.g. a DB row) without
+        running pydantic validation. Callers must pass correctly typed values."""
+        obj = cls.model_construct(**data)
+        if obj.year and not obj.session:
+            obj.session = SessionYear.of(obj.year)
+        return obj
 
-    def __eq__(self, other):
+    def __eq__(self, other: object) -> bool:
         if not isinstance(other, BaseLegislativeContent):
             return False
         return (self.modified_date_time == other.modified_date_time and
@@ -23,9 +36,16 @@ class BaseLegislativeContent(BaseModel):
                 self.session == other.session and
                 self.year == other.year)
 
-    def __hash__(self):
+    def __hash__(self) -> int:
         return hash((self.modified_date_time, self.published_date_time, self.session, self.year))
 
+    def to_json_bytes(self) -> bytes:
+        # Encoded straight to bytes by pydantic-core; committee maps are keyed by
+        # models, which orjson cannot take without a model_dump round trip first.
+        # Map keys are written through CommitteeIdKey/BillIdKey, so the output
+        # validates back with model_validate_json.
+        return to_json(self)
+
     # Functional Getters/Setters
     def is_published(self) -> bool:
         return self.published_date_time is not None
@@ -55,4 +75,4 @@ class BaseLegislativeContent(BaseModel):
         self.session = session
 
     def get_year(self) -> int:
-        return self.year
\ No newline at end of file
+        return self.year
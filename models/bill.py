@@ -1,61 +1,90 @@
 from __future__ import annotations
-from typing import List, Dict, Set, Optional, Any
+import json
+from dataclasses import dataclass
+from typing import List, Dict, FrozenSet, Set, Optional, Any, Tuple
 from datetime import datetime
-from pydantic import BaseModel, Field
-from enum import Enum
-from collections import OrderedDict
+from enum import IntEnum
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+try:  # Optional dependency
+    import orjson
+except ImportError:  # pragma: no cover - fallback
+    orjson = None
 
 from .base_bill_id import BaseBillId
+from .bill_action import BillAction
+from .bill_status import BillStatus
+from .calendar_id import CalendarId
+from .committee_agenda_id import CommitteeAgendaId
+from .committee_version_id import CommitteeVersionId
+from .session_member import SessionMember
+from .bill_type import BillType
 from .version import Version
 from .bill_id import BillId
-from .session_year import SessionYear
 from .chamber import Chamber
 
-# Placeholder classes - need to implement fully later
-class BillStatus(BaseModel):
-    pass
+__all__ = ['Bill', 'BillInfo', 'BillTextFormat', 'BillType']
+
+# Laws are only tracked for amendments published after this date.
+LAW_START_DATE = datetime(2014, 1, 1)
+
+# First session year of each supported congress, indexed by congress number.
+_CONGRESS_TO_SESSION_YEAR = (0,) + tuple(1789 + (congress - 1) * 2 for congress in range(1, 118)) + (2023, 2025)
+
+class BillTextFormat(IntEnum):
+    PLAIN = 0
+    HTML = 1
+    TEMPLATE = 2
 
 class BillAmendment(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     bill_id: BillId
     version: Version
+    # One entry per BillTextFormat, indexed by its value.
+    full_texts: Tuple[str, str, str] = ("", "", "")
+
+    @classmethod
+    def from_trusted(cls, data: dict) -> "BillAmendment":
+        """Builds an amendment from already-validated data (e.g. a DB row) without
+        running pydantic validation. Callers must pass correctly typed values."""
+        return cls.model_construct(**data)
+
+    def get_full_text(self, fmt: BillTextFormat) -> str:
+        return self.full_texts[fmt]
 
     def shallow_clone(self) -> "BillAmendment":
-        return BillAmendment(bill_id=self.bill_id, version=self.version)
+        return BillAmendment(bill_id=self.bill_id, version=self.version, full_texts=self.full_texts)
 
 class PublishStatus(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     effect_date_time: Optional[datetime] = None
 
     def is_published(self) -> bool:
         return True  # Placeholder
 
-class VetoId(BaseModel):
-    pass
-
-class VetoMessage(BaseModel):
-    pass
-
-class ApprovalMessage(BaseModel):
-    pass
-
-class BillSponsor(BaseModel):
-    pass
-
-class SessionMember(BaseModel):
-    pass
-
-class CommitteeVersionId(BaseModel):
+# Placeholder classes - need to implement fully later. The field-less leaves
+# are plain frozen dataclasses so pydantic does no validation work when a Bill
+# is hydrated with them.
+@dataclass(frozen=True, slots=True)
+class VetoId:
     pass
 
-class BillAction(BaseModel):
+@dataclass(frozen=True, slots=True)
+class VetoMessage:
     pass
 
-class ProgramInfo(BaseModel):
+@dataclass(frozen=True, slots=True)
+class ApprovalMessage:
     pass
 
-class CommitteeAgendaId(BaseModel):
+@dataclass(frozen=True, slots=True)
+class BillSponsor:
     pass
 
-class CalendarId(BaseModel):
+@dataclass(frozen=True, slots=True)
+class ProgramInfo:
     pass
 
 class Bill(BaseModel):
@@ -72,12 +101,12 @@ class Bill(BaseModel):
     active_version: Version = Version.ORIGINAL
     sponsor: Optional[BillSponsor] = None
     additional_sponsors: List[SessionMember] = Field(default_factory=list)
-    past_committees: Set[CommitteeVersionId] = Field(default_factory=set)
+    past_committees: FrozenSet[CommitteeVersionId] = frozenset()
     actions: List[BillAction] = Field(default_factory=list)
     substituted_by: Optional[BaseBillId] = None
     reprint_of: Optional[BillId] = None
     direct_previous_version: Optional[BillId] = None
-    all_previous_versions: Set[BillId] = Field(default_factory=set)
+    all_previous_versions: FrozenSet[BillId] = frozenset()
     program_info: Optional[ProgramInfo] = None
     committee_agendas: List[CommitteeAgendaId] = Field(default_factory=list)
     calendars: List[CalendarId] = Field(default_factory=list)
@@ -87,13 +116,41 @@ class Bill(BaseModel):
     federal_source: Optional[str] = None
     session_year: int = Field(..., description="Year of the session")
 
-    def __init__(self, base_bill_id: Optional[BaseBillId] = None, **data):
-        if base_bill_id:
-            data['base_bill_id'] = base_bill_id
-            data['session_year'] = base_bill_id.session.year if base_bill_id.session else None
-        super().__init__(**data)
-        if self.base_bill_id:
-            self.session_year = self.base_bill_id.session.year
+    @model_validator(mode='before')
+    @classmethod
+    def _derive_session_year(cls, data: Any) -> Any:
+        # session_year is required, so it has to be filled in before validation.
+        base_bill_id = data.get('base_bill_id') if isinstance(data, dict) else None
+        if isinstance(base_bill_id, BaseBillId) and base_bill_id.session:
+            data = {**data, 'session_year': base_bill_id.session.year}
+        return data
+
+    @classmethod
+    def from_trusted(cls, data: dict) -> "Bill":
+        """Builds a Bill from already-validated data (e.g. a DB row) without
+        running pydantic validation. Callers must pass correctly typed values;
+        amendment_map entries may also be plain amendment rows."""
+        amendment_map = data.get('amendment_map')
+        if amendment_map:
+            data = {**data, 'amendment_map': {
+                version: BillAmendment.from_trusted(amendment) if isinstance(amendment, dict) else amendment
+                for version, amendment in amendment_map.items()}}
+        # model_construct skips the validator that fills in the required session_year.
+        data = cls._derive_session_year(data)
+        if data.get('session_year') is None:
+            raise ValueError("A trusted Bill needs a base_bill_id with a session, or a session_year.")
+        return cls.model_construct(**data)
+
+    @classmethod
+    def from_json(cls, raw: bytes | str) -> "Bill":
+        """Parses a Bill from a JSON feed record, using orjson when installed."""
+        data = orjson.loads(raw) if orjson else json.loads(raw)
+        base_bill_id = data.pop('base_bill_id', None)
+        if isinstance(base_bill_id, dict):
+            # A base id is always the original version; BaseBillId sets it itself.
+            base_bill_id.pop('version', None)
+            base_bill_id = BaseBillId(**base_bill_id)
+        return cls(base_bill_id=base_bill_id, **data)
 
     def compare_to(self, other: "Bill") -> int:
         return self.base_bill_id.compare_to(other.base_bill_id)
@@ -119,7 +176,7 @@ class Bill(BaseModel):
     def get_base_print_no(self) -> str:
         return self.base_bill_id.get_base_print_no()
 
-    def get_bill_type(self) -> "BillType":
+    def get_bill_type(self) -> BillType:
         return self.base_bill_id.get_bill_type()
 
     def get_chamber(self) -> Chamber:
@@ -136,6 +193,8 @@ class Bill(BaseModel):
             return self.amendment_map[version]
         raise ValueError(f"Bill amendment not found for version {version}")
 
+    # Not cached: amendment_map is public and reassigned or edited in place
+    # (shallow_clone, get_amendment_map callers), so a cached view would go stale.
     def get_amendment_list(self) -> List[BillAmendment]:
         return list(self.amendment_map.values())
 
@@ -183,7 +242,7 @@ class Bill(BaseModel):
         self.active_version = active_version
         if active_version not in self.amendment_map:
             self.amendment_map[active_version] = BillAmendment(
-                bill_id=BillId(base_bill_id=self.base_bill_id, version=active_version),
+                bill_id=self.base_bill_id.with_version(active_version),
                 version=active_version
             )
 
@@ -194,11 +253,13 @@ class Bill(BaseModel):
         self.actions.append(action)
 
     def add_past_committee(self, committee_version_id: CommitteeVersionId) -> None:
-        self.past_committees.add(committee_version_id)
+        # Frozen so the set can be shared between clones;
+        # a bill only ever collects a handful of committees.
+        self.past_committees = self.past_committees | {committee_version_id}
 
     def get_full_text_plain(self) -> str:
         if self.has_active_amendment():
-            return self.get_active_amendment().get_full_text("PLAIN")
+            return self.get_active_amendment().get_full_text(BillTextFormat.PLAIN)
         return ""
 
     # Getters and setters
@@ -259,11 +320,11 @@ class Bill(BaseModel):
     def set_direct_previous_version(self, direct_previous_version: BillId) -> None:
         self.direct_previous_version = direct_previous_version
 
-    def get_all_previous_versions(self) -> Set[BillId]:
+    def get_all_previous_versions(self) -> FrozenSet[BillId]:
         return self.all_previous_versions
 
     def set_all_previous_versions(self, previous_versions: Set[BillId]) -> None:
-        self.all_previous_versions = previous_versions
+        self.all_previous_versions = frozenset(previous_versions)
 
     def get_substituted_by(self) -> Optional[BaseBillId]:
         return self.substituted_by
@@ -286,11 +347,11 @@ class Bill(BaseModel):
     def set_ldblurb(self, blurb: str) -> None:
         self.ldblurb = blurb
 
-    def get_past_committees(self) -> Set[CommitteeVersionId]:
+    def get_past_committees(self) -> FrozenSet[CommitteeVersionId]:
         return self.past_committees
 
     def set_past_committees(self, past_committees: Set[CommitteeVersionId]) -> None:
-        self.past_committees = past_committees
+        self.past_committees = frozenset(past_committees)
 
     def get_additional_sponsors(self) -> List[SessionMember]:
         return self.additional_sponsors
@@ -342,12 +403,8 @@ class Bill(BaseModel):
 
     @staticmethod
     def congress_to_session_year(congress: int) -> int:
-        if 1 <= congress <= 117:
-            return 1789 + (congress - 1) * 2
-        elif congress == 118:
-            return 2023
-        elif congress == 119:
-            return 2025
+        if 0 < congress < len(_CONGRESS_TO_SESSION_YEAR):
+            return _CONGRESS_TO_SESSION_YEAR[congress]
         raise ValueError(f"Unsupported congress number: {congress}")
 
     def set_reprint_of(self, reprint_of: BillId) -> None:
@@ -365,23 +422,7 @@ class Bill(BaseModel):
         publish_date = status.effect_date_time
         if publish_date is None:
             return False
-        law_start_date = datetime(2014, 1, 1)
-        return publish_date > law_start_date
+        return publish_date > LAW_START_DATE
 
 class BillInfo(BaseModel):
     bill: Bill
-
-class BillType(str, Enum):
-    ASSEMBLY = "A"
-    SENATE = "S"
-    # Add other types as needed
-
-    def get_chamber(self) -> Chamber:
-        if self.value == "A":
-            return Chamber.ASSEMBLY
-        elif self.value == "S":
-            return Chamber.SENATE
-        return Chamber.SENATE  # Default
-
-    def is_resolution(self) -> bool:
-        return self.value in ["R", "J", "K", "L", "E"]  # Simplified
\ No newline at end of file
@@ -1,23 +1,29 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import datetime
+import sys
+from dataclasses import dataclass, field
 from datetime import date
-from functools import total_ordering
 from typing import Optional
 
 from .bill_id import BillId
 from .chamber import Chamber
 
 
-@total_ordering
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BillAction:
     bill_id: BillId
-    date: Optional[date]
+    # Qualified so the annotation does not resolve to this field's own slot.
+    date: Optional[datetime.date]
     chamber: Optional[Chamber]
     sequence_no: int
     text: str
     action_type: Optional[str] = None
+    # Derived once in __post_init__: actions are hashed and compared in dedup passes,
+    # which would otherwise rehash every field and re-lowercase the text each time.
+    # The fold is interned since feed actions mostly repeat the same few texts.
+    _hash: int = field(init=False, repr=False, compare=False)
+    _text_fold: str = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         if self.bill_id is None:
@@ -26,23 +32,63 @@ class BillAction:
             object.__setattr__(self, "text", "")
         if self.sequence_no is None:
             object.__setattr__(self, "sequence_no", 0)
+        object.__setattr__(self, "_text_fold", sys.intern(self.text.lower()))
+        object.__setattr__(self, "_hash", hash((self.bill_id, self.date, self.chamber, self.sequence_no,
+                                                self.text, self.action_type)))
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    # Same fields as the generated __eq__, but compared cheapest-first and without
+    # building a tuple per side.
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (
+            self.sequence_no == other.sequence_no
+            and self.date == other.date
+            and self.chamber == other.chamber
+            and self.action_type == other.action_type
+            and self.text == other.text
+            and self.bill_id == other.bill_id
+        )
 
     def __str__(self) -> str:
         chamber = self.chamber.name if self.chamber else ""
         date_str = self.date.isoformat() if self.date else ""
         return f"{date_str} ({chamber}) {self.text}".strip()
 
+    # Actions order by sequence number alone. Spelled out rather than derived with
+    # total_ordering, which routes <=, > and >= through an extra Python call.
     def __lt__(self, other: "BillAction") -> bool:
         if not isinstance(other, BillAction):
             return NotImplemented
         return self.sequence_no < other.sequence_no
 
+    def __le__(self, other: "BillAction") -> bool:
+        if not isinstance(other, BillAction):
+            return NotImplemented
+        return self.sequence_no <= other.sequence_no
+
+    def __gt__(self, other: "BillAction") -> bool:
+        if not isinstance(other, BillAction):
+            return NotImplemented
+        return self.sequence_no > other.sequence_no
+
+    def __ge__(self, other: "BillAction") -> bool:
+        if not isinstance(other, BillAction):
+            return NotImplemented
+        return self.sequence_no >= other.sequence_no
+
     def equals_base(self, other: "BillAction") -> bool:
         return (
             isinstance(other, BillAction)
-            and self.bill_id.equals_base(other.bill_id)
             and self.sequence_no == other.sequence_no
             and (self.date or date.min) == (other.date or date.min)
             and (self.chamber or Chamber.SENATE) == (other.chamber or Chamber.SENATE)
-            and self.text.lower() == other.text.lower()
+            and self.bill_id.equals_base(other.bill_id)
+            # Interned, so matching texts are usually the same object.
+            and (self._text_fold is other._text_fold or self._text_fold == other._text_fold)
         )
@@ -0,0 +1,96 @@
+from __future__ import annotations
+from typing import Iterator, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from .base_bill_id import BaseBillId
+from .bill import LAW_START_DATE, Bill
+from .version import Version
+
+_VERSIONS = tuple(Version)
+_VERSION_INDEX = {version: i for i, version in enumerate(_VERSIONS)}
+# Stand-in for None in the integer columns; chapter numbers, years and congress
+# numbers are all positive.
+_MISSING = -1
+
+class BillView(NamedTuple):
+    base_bill_id: BaseBillId
+    title: str
+    active_version: Version
+    chapter_num: Optional[int]
+    chapter_year: Optional[int]
+    federal_congress: Optional[int]
+
+def _column(values: Sequence[Optional[int]]) -> np.ndarray:
+    return np.fromiter((_MISSING if v is None else v for v in values), dtype=np.int32, count=len(values))
+
+def _active_effect_date_time(bill: Bill):
+    if not bill.has_active_amendment():
+        return None
+    status = bill.amend_publish_status_map.get(bill.active_version)
+    return status.effect_date_time if status else None
+
+def _optional(value: int) -> Optional[int]:
+    return None if value == _MISSING else value
+
+class BillColumnStore:
+    """Column-oriented snapshot of the scalar Bill fields read by bulk passes
+    (indexing, exports, reports). Build it once from a list of Bills and scan
+    the arrays instead of walking the full models."""
+
+    def __init__(self, base_bill_ids: List[BaseBillId], titles: np.ndarray, active_versions: np.ndarray,
+                 chapter_nums: np.ndarray, chapter_years: np.ndarray, federal_congresses: np.ndarray,
+                 active_effect_date_times: np.ndarray, designators: np.ndarray, numbers: np.ndarray):
+        self.base_bill_ids = base_bill_ids
+        self.titles = titles
+        self.active_versions = active_versions
+        self.chapter_nums = chapter_nums
+        self.chapter_years = chapter_years
+        self.federal_congresses = federal_congresses
+        # NaT where the active amendment is missing or unpublished.
+        self.active_effect_date_times = active_effect_date_times
+        self.designators = designators
+        self.numbers = numbers
+
+    @classmethod
+    def from_bills(cls, bills: Sequence[Bill]) -> 'BillColumnStore':
+        titles = np.empty(len(bills), dtype=object)
+        titles[:] = [bill.title for bill in bills]
+        return cls(
+            base_bill_ids=[bill.base_bill_id for bill in bills],
+            titles=titles,
+            active_versions=np.fromiter((_VERSION_INDEX[bill.active_version] for bill in bills),
+                                        dtype=np.int8, count=len(bills)),
+            chapter_nums=_column([bill.chapter_num for bill in bills]),
+            chapter_years=_column([bill.chapter_year for bill in bills]),
+            federal_congresses=_column([bill.federal_congress for bill in bills]),
+            active_effect_date_times=np.array([_active_effect_date_time(bill) for bill in bills],
+                                              dtype='datetime64[us]'),
+            designators=np.array([bill.base_bill_id.base_print_no[0] for bill in bills], dtype='U1'),
+            numbers=_column([bill.base_bill_id.number for bill in bills]),
+        )
+
+    def __len__(self) -> int:
+        return len(self.base_bill_ids)
+
+    def valid_laws_mask(self) -> np.ndarray:
+        """Vectorized Bill.has_valid_laws(bill.active_version) over every row."""
+        # NaT compares False, covering the missing amendment/status cases.
+        return self.active_effect_date_times > np.datetime64(LAW_START_DATE, 'us')
+
+    def padded_print_numbers(self) -> np.ndarray:
+        """Vectorized base_bill_id.padded_print_number over every row, for bulk exports."""
+        if not len(self.numbers):
+            # np.char.zfill takes a max over the widths, which fails on empty input.
+            return np.empty(0, dtype='U1')
+        return np.char.add(self.designators, np.char.zfill(self.numbers.astype(str), 5))
+
+    def iter_views(self) -> Iterator[BillView]:
+        # tolist() converts each column to Python ints in one C pass rather than
+        # boxing a numpy scalar per element.
+        columns = zip(self.base_bill_ids, self.titles.tolist(), self.active_versions.tolist(),
+                      self.chapter_nums.tolist(), self.chapter_years.tolist(),
+                      self.federal_congresses.tolist())
+        for base_bill_id, title, version, chapter_num, chapter_year, congress in columns:
+            yield BillView(base_bill_id, title, _VERSIONS[version], _optional(chapter_num),
+                           _optional(chapter_year), _optional(congress))
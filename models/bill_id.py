@@ -1,22 +1,74 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, BeforeValidator, ConfigDict
+from typing import Annotated, ClassVar, Optional, Tuple
 import re
+import sys
+from functools import cached_property
+from weakref import WeakValueDictionary
 
 from .version import Version
 from .session_year import SessionYear
 from .chamber import Chamber
 from .bill_type import BillType
 
+# Keyed on the leading letter of a print no; get_bill_type/get_chamber run for
+# every bill touched while assembling calendars and agendas.
+_BILL_TYPE_BY_CODE = {bill_type.value: bill_type for bill_type in BillType}
+_CHAMBER_BY_CODE = {bill_type.value: bill_type.get_chamber() for bill_type in BillType}
+
+# Shared instances handed out by BillId.get, keyed on (class, session year, base print no, version).
+# Weak so ids drop out once no bill references them.
+_POOL: 'WeakValueDictionary[tuple, BillId]' = WeakValueDictionary()
+
+_DIGITS = frozenset('0123456789')
+_NON_DIGIT_RE = re.compile(r'[^\d]')
+_NON_ALNUM_RE = re.compile(r'[^A-Z0-9]')
+
+def _split_print_no(print_no: str) -> Optional[Tuple[str, str, str]]:
+    """Splits a print no into (designator, digits, remainder), or returns None if it
+    does not start the way PRINT_NUMBER_PATTERN requires. A plain scan is much
+    cheaper than the regex engine on strings this short."""
+    if not print_no or print_no[0] not in _BILL_TYPE_BY_CODE:
+        return None
+    end = 1
+    while end < len(print_no) and print_no[end] in _DIGITS:
+        end += 1
+    if end == 1:
+        return None
+    return print_no[0], print_no[1:end], print_no[end:]
+
 class BillId(BaseModel):
-    PRINT_NUMBER_REGEX = r"([ASLREJKBC])(\d+)([A-Z]?)"
-    PRINT_NUMBER_PATTERN = re.compile(PRINT_NUMBER_REGEX)
-    BILL_ID_PATTERN = re.compile(rf"(?P<printNo>{PRINT_NUMBER_REGEX})-(?P<year>\d{{4}})")
-    DEFAULT_VERSION = Version.ORIGINAL
+    PRINT_NUMBER_REGEX: ClassVar[str] = r"([ASLREJKBC])(\d+)([A-Z]?)"
+    PRINT_NUMBER_PATTERN: ClassVar[re.Pattern] = re.compile(PRINT_NUMBER_REGEX)
+    BILL_ID_PATTERN: ClassVar[re.Pattern] = re.compile(rf"(?P<printNo>{PRINT_NUMBER_REGEX})-(?P<year>\d{{4}})")
+    DEFAULT_VERSION: ClassVar[Version] = Version.ORIGINAL
+
+    model_config = ConfigDict(frozen=True, extra='forbid')
 
     base_print_no: str
     session: SessionYear
     version: Version = DEFAULT_VERSION
 
+    # Bill ids key amendment maps, vote maps and previous-version sets and are sorted
+    # in bulk, so the hash and ordering key are computed once per instance. They are
+    # cached properties rather than PrivateAttrs: private attributes are read through
+    # BaseModel.__getattr__, which costs more than rebuilding the tuple.
+    @cached_property
+    def _hash(self) -> int:
+        return 31 * self.hash_code_base() + hash(self.version)
+
+    @cached_property
+    def _sort_key(self) -> tuple:
+        return self.sort_key()
+
+    def model_copy(self, *, update: Optional[dict] = None, deep: bool = False) -> 'BillId':
+        # model_copy copies __dict__, cached properties included; drop them so a copy
+        # with updated fields derives its own.
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            for name in _CACHED_PROPERTIES:
+                copied.__dict__.pop(name, None)
+        return copied
+
     def __init__(self, print_no: Optional[str] = None, session: Optional[int] = None, version: Optional[str] = None,
                  base_print_no: Optional[str] = None, base_bill_id: Optional['BaseBillId'] = None, **data):
         if base_bill_id:
@@ -33,43 +85,72 @@ class BillId(BaseModel):
             self.check_base_print_has_no_version(print_no)
             base_print_no = print_no
             version = parsed_version
-        if isinstance(session, int):
-            session = SessionYear(year=session)
-        if isinstance(version, str):
+        # Exact type checks: Version is a str enum, so isinstance() sent members that
+        # were already parsed back through Version.of.
+        if type(session) is int:
+            session = SessionYear.of(session)
+        if type(version) is str:
             version = Version.of(version)
-        if session:
-            self.check_session_year(session)
         super().__init__(base_print_no=base_print_no, session=session, version=version or self.DEFAULT_VERSION, **data)
 
+    @classmethod
+    def get(cls, session: SessionYear, base_print_no: str, version: Version = DEFAULT_VERSION) -> 'BillId':
+        """Returns the shared instance for an already normalized id, skipping validation.
+        Parsing many records builds the same ids over and over; pooling collapses them."""
+        # model_construct does no coercion, and a str version would be shared through the pool.
+        if type(version) is not Version:
+            version = Version.of(version)
+        key = (cls, session.year, base_print_no, version)
+        bill_id = _POOL.get(key)
+        if bill_id is None:
+            bill_id = _POOL[key] = cls.model_construct(base_print_no=base_print_no, session=session,
+                                                       version=version)
+        return bill_id
+
     @classmethod
     def get_base_id(cls, bill_id: 'BillId') -> 'BaseBillId':
         from .base_bill_id import BaseBillId
-        return BaseBillId(base_print_no=bill_id.base_print_no, session=bill_id.session)
+        return BaseBillId.get(bill_id.session, bill_id.base_print_no)
 
-    def get_print_no(self) -> str:
+    # Ids are frozen, so the derived strings are computed once per instance and
+    # kept in __dict__; pydantic leaves cached properties out of eq and dumps.
+    @cached_property
+    def print_no(self) -> str:
         return self.base_print_no + str(self.version)
 
+    @cached_property
+    def number(self) -> int:
+        return int(_NON_DIGIT_RE.sub('', self.base_print_no))
+
+    @cached_property
+    def padded_print_number(self) -> str:
+        parts = _split_print_no(self.print_no)
+        if parts:
+            designator, digits, rest = parts
+            return f"{designator}{int(digits):05d}{rest[:1]}"
+        return ""
+
+    def get_print_no(self) -> str:
+        return self.print_no
+
     def get_bill_type(self) -> BillType:
-        return BillType(self.base_print_no[0])
+        return _BILL_TYPE_BY_CODE[self.base_print_no[0]]
 
     def get_chamber(self) -> Chamber:
-        return self.get_bill_type().get_chamber()
+        return _CHAMBER_BY_CODE[self.base_print_no[0]]
 
     def get_number(self) -> int:
-        return int(re.sub(r'[^\d]', '', self.base_print_no))
+        return self.number
 
     @staticmethod
     def is_base_version(version: Version) -> bool:
         return version is None or version == BillId.DEFAULT_VERSION
 
     def get_padded_bill_id_string(self) -> str:
-        return self.get_padded_print_number() + "-" + str(self.session.year)
+        return self.padded_print_number + "-" + str(self.session.year)
 
     def get_padded_print_number(self) -> str:
-        matcher = self.PRINT_NUMBER_PATTERN.match(self.get_print_no())
-        if matcher:
-            return f"{matcher.group(1)}{int(matcher.group(2)):05d}{matcher.group(3)}"
-        return ""
+        return self.padded_print_number
 
     @staticmethod
     def normalize_print_no(print_no: str) -> str:
@@ -77,18 +158,15 @@ class BillId(BaseModel):
             raise ValueError("PrintNo when constructing BillId cannot be null/empty.")
         # Remove all non-alphanumeric characters from the printNo.
         print_no = print_no.strip().upper()
-        print_no = re.sub(r'[^A-Z0-9]', '', print_no)
-        # Check that printNo matches the pattern
-        if not BillId.PRINT_NUMBER_PATTERN.match(print_no):
-            raise ValueError(f"PrintNo ({print_no}) does not match print no pattern ({BillId.PRINT_NUMBER_PATTERN.pattern()})")
-        # Check that printNo starts with a valid bill type designator
-        try:
-            BillType(print_no[0])
-        except ValueError as exc:
-            raise ValueError(f"PrintNo ({print_no}) must begin with a valid letter designator.")
-        # Trim leading 0's after the first character
-        print_no = print_no[0] + print_no[1:].lstrip('0')
-        return print_no
+        print_no = _NON_ALNUM_RE.sub('', print_no)
+        # Check that printNo is a bill type designator followed by digits
+        parts = _split_print_no(print_no)
+        if parts is None:
+            raise ValueError(f"PrintNo ({print_no}) does not match print no pattern ({BillId.PRINT_NUMBER_PATTERN.pattern})")
+        designator, digits, rest = parts
+        # Trim leading 0's from the number, keeping at least one digit. Interned so the
+        # many BillIds built for the same bill share one string and compare by identity first.
+        return sys.intern(designator + (digits.lstrip('0') or '0') + rest)
 
     @staticmethod
     def check_base_print_has_no_version(base_print_no: str):
@@ -103,7 +181,7 @@ class BillId(BaseModel):
     def __str__(self) -> str:
         return f"{self.base_print_no}{str(self.version)}-{self.session.year}"
 
-    def __eq__(self, other) -> bool:
+    def __eq__(self, other: object) -> bool:
         if other is None:
             return False
         if not self.equals_base(other):
@@ -111,9 +189,9 @@ class BillId(BaseModel):
         return self.version == other.version
 
     def __hash__(self) -> int:
-        return 31 * self.hash_code_base() + hash(self.version)
+        return self._hash
 
-    def equals_base(self, other) -> bool:
+    def equals_base(self, other: object) -> bool:
         if self is other:
             return True
         if not isinstance(other, BillId):
@@ -121,14 +199,28 @@ class BillId(BaseModel):
         return self.session == other.session and self.base_print_no == other.base_print_no
 
     def hash_code_base(self) -> int:
-        return hash((self.base_print_no, self.session))
+        return hash((self.base_print_no, self.session.year))
+
+    def sort_key(self) -> tuple:
+        # Plain ints and strs, so comparisons stay in C rather than going
+        # through SessionYear.__eq__/__lt__.
+        return (self.session.year, self.base_print_no, self.version.value)
+
+    def __lt__(self, other: 'BillId') -> bool:
+        return self._sort_key < other._sort_key
+
+    def __le__(self, other: 'BillId') -> bool:
+        return self._sort_key <= other._sort_key
+
+    def __gt__(self, other: 'BillId') -> bool:
+        return self._sort_key > other._sort_key
 
-    def __lt__(self, other) -> bool:
-        if self.session != other.session:
-            return self.session < other.session
-        if self.base_print_no != other.base_print_no:
-            return self.base_print_no < other.base_print_no
-        return self.version.value < other.version.value
+    def __ge__(self, other: 'BillId') -> bool:
+        return self._sort_key >= other._sort_key
+
+    def compare_to(self, other: 'BillId') -> int:
+        a, b = self._sort_key, other._sort_key
+        return (a > b) - (a < b)
 
     # Getters
     def get_base_print_no(self) -> str:
@@ -141,4 +233,21 @@ class BillId(BaseModel):
         return self.version
 
     def with_version(self, version: Version) -> 'BillId':
-        return BillId(base_print_no=self.base_print_no, session=self.session, version=version)
+        return BillId.get(self.session, self.base_print_no, version)
+
+
+_CACHED_PROPERTIES = tuple(name for name, attr in vars(BillId).items() if isinstance(attr, cached_property))
+
+
+def _bill_id_from_key(value):
+    # JSON map keys hold the str() form, e.g. S1234A-2023
+    if isinstance(value, str):
+        match = BillId.BILL_ID_PATTERN.fullmatch(value)
+        if match is None:
+            raise ValueError(f"{value!r} is not a valid bill id")
+        return BillId(print_no=match.group('printNo'), session=int(match.group('year')))
+    return value
+
+
+# Key type for pydantic maps keyed by bill id, so JSON output validates back.
+BillIdKey = Annotated[BillId, BeforeValidator(_bill_id_from_key)]
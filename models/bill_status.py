@@ -20,6 +20,12 @@ class BillStatus(BaseModel):
         "validate_assignment": True,
     }
 
+    @classmethod
+    def from_trusted(cls, data: dict) -> "BillStatus":
+        """Builds an instance from already-validated data (e.g. a DB row) without
+        running pydantic validation. Callers must pass correctly typed values."""
+        return cls.model_construct(**data)
+
     @field_validator("action_sequence_no")
     @classmethod
     def _validate_sequence(cls, value: int) -> int:
@@ -21,12 +21,10 @@ class BillStatusType(str, Enum):
     def __new__(cls, value: str, description: str):
         obj = str.__new__(cls, value)
         obj._value_ = value
-        obj._description = description
+        # A plain member attribute rather than a property: enum members are read
+        # constantly and the descriptor call costs more than the lookup itself.
+        obj.description = description
         return obj
 
-    @property
-    def description(self) -> str:
-        return self._description
-
     def get_desc(self) -> str:
-        return self._description
+        return self.description
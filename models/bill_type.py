@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from enum import Enum
+from typing import Dict
 
 from .chamber import Chamber
 
@@ -19,24 +20,18 @@ class BillType(str, Enum):
     def __new__(cls, value: str, chamber: Chamber, name: str, resolution: bool):
         obj = str.__new__(cls, value)
         obj._value_ = value
-        obj._chamber = chamber
-        obj._full_name = name
+        # Plain member attributes rather than properties, which would add a
+        # descriptor call to every read in the bill sorting/grouping paths.
+        obj.chamber = chamber
+        obj.full_name = name
         obj._is_resolution = resolution
         return obj
 
-    @property
-    def chamber(self) -> Chamber:
-        return self._chamber
-
-    @property
-    def full_name(self) -> str:
-        return self._full_name
-
     def get_chamber(self) -> Chamber:
-        return self._chamber
+        return self.chamber
 
     def get_name(self) -> str:
-        return self._full_name
+        return self.full_name
 
     def is_resolution(self) -> bool:
         return self._is_resolution
@@ -45,8 +40,10 @@ class BillType(str, Enum):
     def from_value(cls, value: str) -> "BillType":
         if value is None:
             raise ValueError("BillType value cannot be None")
-        normalized = value.strip().upper()
-        try:
-            return cls(normalized)
-        except ValueError as exc:
-            raise ValueError(f"Unknown bill type '{value}'") from exc
+        bill_type = _BILL_TYPES_BY_VALUE.get(value.strip().upper())
+        if bill_type is None:
+            raise ValueError(f"Unknown bill type '{value}'")
+        return bill_type
+
+
+_BILL_TYPES_BY_VALUE: Dict[str, BillType] = {bill_type.value: bill_type for bill_type in BillType}
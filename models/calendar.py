@@ -1,14 +1,23 @@
 from __future__ import annotations
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 from typing import Dict, Optional, List
 from datetime import date, datetime
-from enum import EnumMap
-from collections import OrderedDict
 
 from .calendar_id import CalendarId
 from .version import Version
 from .session_year import SessionYear
 
+# Version ordinals, for keeping supplemental_map in the same order as the Java EnumMap
+# regardless of insertion order.
+_VERSION_INDEX = {version: i for i, version in enumerate(Version)}
+
+
+def _order_by_version(supplemental_map: Dict[Version, "CalendarSupplemental"]) -> None:
+    """Reorders supplemental_map in place so iteration follows version order."""
+    ordered = sorted(supplemental_map.items(), key=lambda item: _VERSION_INDEX[item[0]])
+    supplemental_map.clear()
+    supplemental_map.update(ordered)
+
 # Placeholder classes - need to implement fully later
 class CalendarSupplemental(BaseModel):
     version: Version
@@ -49,11 +58,18 @@ class CalendarEntryListId(BaseModel):
 
 class Calendar(BaseModel):
     id: Optional[CalendarId] = None
-    supplemental_map: EnumMap[Version, CalendarSupplemental] = Field(default_factory=lambda: EnumMap(Version))
-    active_list_map: OrderedDict[int, CalendarActiveList] = Field(default_factory=OrderedDict)
+    supplemental_map: Dict[Version, CalendarSupplemental] = Field(default_factory=dict)
+    active_list_map: Dict[int, CalendarActiveList] = Field(default_factory=dict)
     session_year: int = Field(..., description="Year of the session")
     published_date_time: Optional[datetime] = None
 
+    # supplemental_map is kept in version order as it is written, so reads never sort
+    @field_validator('supplemental_map')
+    @classmethod
+    def _validate_supplemental_order(cls, value: Dict[Version, CalendarSupplemental]) -> Dict[Version, CalendarSupplemental]:
+        _order_by_version(value)
+        return value
+
     def __init__(self, calendar_id: Optional[CalendarId] = None, **data):
         super().__init__(**data)
         if calendar_id:
@@ -75,7 +91,14 @@ class Calendar(BaseModel):
         return self.supplemental_map.get(version)
 
     def put_supplemental(self, supplemental: CalendarSupplemental) -> None:
-        self.supplemental_map[supplemental.version] = supplemental
+        supplementals = self.supplemental_map
+        version = supplemental.version
+        # Supplementals normally arrive in version order, so this is usually an append
+        in_order = (version in supplementals or not supplementals or
+                    _VERSION_INDEX[version] > _VERSION_INDEX[next(reversed(supplementals))])
+        supplementals[version] = supplemental
+        if not in_order:
+            _order_by_version(supplementals)
 
     def remove_supplemental(self, version: Version) -> None:
         self.supplemental_map.pop(version, None)
@@ -83,7 +106,7 @@ class Calendar(BaseModel):
     def get_cal_date(self) -> Optional[date]:
         if self.supplemental_map:
             return next(iter(self.supplemental_map.values())).cal_date
-        elif self.active_list_map:
+        if self.active_list_map:
             return next(iter(self.active_list_map.values())).cal_date
         return None
 
@@ -102,35 +125,37 @@ class Calendar(BaseModel):
             self.published_date_time == other.published_date_time
         )
 
+    # Calendars are keyed by id in practice, so the hash covers only the cheap fields.
+    # Equal calendars still hash equal; the map contents are left to __eq__.
     def __hash__(self) -> int:
-        return hash((self.id, tuple(self.supplemental_map.items()), tuple(self.active_list_map.items()), self.published_date_time))
+        return hash((self.id, len(self.active_list_map), self.published_date_time))
 
     # Getters and setters
     def get_id(self) -> Optional[CalendarId]:
         return self.id
 
     def get_calendar_entry_list_ids(self) -> List[CalendarEntryListId]:
-        calendar_entry_list_ids = []
-        for supplemental in self.supplemental_map.values():
-            calendar_entry_list_ids.append(supplemental.get_calendar_supplemental_id().to_calendar_entry_list_id())
-        for active_list in self.active_list_map.values():
-            calendar_entry_list_ids.append(active_list.get_calendar_active_list_id().to_calendar_entry_list_id())
+        calendar_entry_list_ids = [supplemental.get_calendar_supplemental_id().to_calendar_entry_list_id()
+                                   for supplemental in self.supplemental_map.values()]
+        calendar_entry_list_ids.extend(active_list.get_calendar_active_list_id().to_calendar_entry_list_id()
+                                       for active_list in self.active_list_map.values())
         return calendar_entry_list_ids
 
     def set_id(self, calendar_number: int, year: int) -> None:
-        self.id = CalendarId(calendar_number=calendar_number, year=year)
+        self.id = CalendarId(year=year, cal_no=calendar_number)
 
     def set_id_from_calendar_id(self, id_: CalendarId) -> None:
         self.id = id_
 
-    def get_supplemental_map(self) -> EnumMap[Version, CalendarSupplemental]:
+    def get_supplemental_map(self) -> Dict[Version, CalendarSupplemental]:
         return self.supplemental_map
 
-    def set_supplemental_map(self, supplemental_map: EnumMap[Version, CalendarSupplemental]) -> None:
-        self.supplemental_map = supplemental_map
+    def set_supplemental_map(self, supplemental_map: Dict[Version, CalendarSupplemental]) -> None:
+        # Sorted into a new dict so the caller's map is left as passed in
+        self.supplemental_map = dict(sorted(supplemental_map.items(), key=lambda item: _VERSION_INDEX[item[0]]))
 
-    def get_active_list_map(self) -> OrderedDict[int, CalendarActiveList]:
+    def get_active_list_map(self) -> Dict[int, CalendarActiveList]:
         return self.active_list_map
 
-    def set_active_list_map(self, active_list_map: OrderedDict[int, CalendarActiveList]) -> None:
-        self.active_list_map = active_list_map
\ No newline at end of file
+    def set_active_list_map(self, active_list_map: Dict[int, CalendarActiveList]) -> None:
+        self.active_list_map = active_list_map
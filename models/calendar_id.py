@@ -1,19 +1,14 @@
-from pydantic import BaseModel
+from __future__ import annotations
 
-class CalendarId(BaseModel):
-    cal_no: int
+from dataclasses import dataclass
+
+
+# Fields are ordered (year, cal_no) so the generated comparisons sort by year
+# first; kw_only keeps callers from depending on the positional order.
+@dataclass(frozen=True, slots=True, order=True, kw_only=True)
+class CalendarId:
     year: int
+    cal_no: int
 
     def __str__(self):
         return f"#{self.cal_no} ({self.year})"
-
-    def __eq__(self, other):
-        return isinstance(other, CalendarId) and self.cal_no == other.cal_no and self.year == other.year
-
-    def __hash__(self):
-        return hash((self.cal_no, self.year))
-
-    def __lt__(self, other: 'CalendarId'):
-        if self.year != other.year:
-            return self.year < other.year
-        return self.cal_no < other.cal_no
\ No newline at end of file
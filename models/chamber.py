@@ -1,4 +1,5 @@
 from enum import Enum
+from typing import Dict
 
 
 class Chamber(Enum):
@@ -12,10 +13,18 @@ class Chamber(Enum):
         return self.name.lower()
 
     def opposite(self) -> "Chamber":
-        return Chamber.ASSEMBLY if self is Chamber.SENATE else Chamber.SENATE
+        return _OPPOSITES[self]
 
     @staticmethod
     def get_value(value: str):
         if value is None:
             raise ValueError("Supplied value cannot be null when mapping to Chamber.")
-        return Chamber(value.strip().upper())
+        chamber = _CHAMBERS_BY_KEY.get(value.strip().upper())
+        if chamber is None:
+            raise ValueError(f"{value!r} is not a valid Chamber")
+        return chamber
+
+
+# Parser rows carry either the abbreviation or the full name.
+_CHAMBERS_BY_KEY: Dict[str, Chamber] = {key: chamber for chamber in Chamber for key in (chamber.value, chamber.name)}
+_OPPOSITES: Dict[Chamber, Chamber] = {Chamber.SENATE: Chamber.ASSEMBLY, Chamber.ASSEMBLY: Chamber.SENATE}
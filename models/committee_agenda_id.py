@@ -1,35 +1,49 @@
-from pydantic import BaseModel
-from typing import Optional
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional, Tuple
 
 from .agenda_id import AgendaId
 from .committee_id import CommitteeId
-from .version import Version
 
-class CommitteeAgendaId(BaseModel):
+
+# Ordering is defined here rather than generated per class, so base and addendum
+# ids sort together: generated comparisons only accept the exact same class.
+@dataclass(frozen=True, slots=True)
+class CommitteeAgendaId:
     agenda_id: Optional[AgendaId] = None
     committee_id: Optional[CommitteeId] = None
 
     def __str__(self):
         return f"{self.agenda_id}-{self.committee_id}"
 
-    def __eq__(self, other):
-        if self is other:
-            return True
+    def sort_key(self) -> Tuple:
+        """Ordering key; subclasses extend it with their own fields."""
+        return self.agenda_id, self.committee_id
+
+    def __lt__(self, other: "CommitteeAgendaId") -> bool:
         if not isinstance(other, CommitteeAgendaId):
-            return False
-        return self.agenda_id == other.agenda_id and self.committee_id == other.committee_id
+            return NotImplemented
+        return self.sort_key() < other.sort_key()
 
-    def __hash__(self):
-        return hash((self.agenda_id, self.committee_id))
+    def __le__(self, other: "CommitteeAgendaId") -> bool:
+        if not isinstance(other, CommitteeAgendaId):
+            return NotImplemented
+        return self.sort_key() <= other.sort_key()
 
-    def __lt__(self, other: 'CommitteeAgendaId'):
-        if self.agenda_id != other.agenda_id:
-            return self.agenda_id < other.agenda_id
-        return self.committee_id < other.committee_id
+    def __gt__(self, other: "CommitteeAgendaId") -> bool:
+        if not isinstance(other, CommitteeAgendaId):
+            return NotImplemented
+        return self.sort_key() > other.sort_key()
+
+    def __ge__(self, other: "CommitteeAgendaId") -> bool:
+        if not isinstance(other, CommitteeAgendaId):
+            return NotImplemented
+        return self.sort_key() >= other.sort_key()
 
     # Basic Getters/Setters
     def get_agenda_id(self) -> Optional[AgendaId]:
         return self.agenda_id
 
     def get_committee_id(self) -> Optional[CommitteeId]:
-        return self.committee_id
\ No newline at end of file
+        return self.committee_id
@@ -1,42 +1,46 @@
 from __future__ import annotations
 
-from functools import total_ordering
-from typing import Optional
+import sys
+from dataclasses import dataclass, field
+from typing import Annotated, Tuple
 
-from pydantic import BaseModel, field_validator
+from pydantic import BeforeValidator, PlainSerializer
 
 from .chamber import Chamber
 
 
-@total_ordering
-class CommitteeId(BaseModel):
+# A plain frozen dataclass rather than a pydantic model: committee ids are built
+# in bulk and key the agenda/committee maps, and they need no more validation than
+# the checks in __post_init__.
+@dataclass(frozen=True, slots=True, eq=False)
+class CommitteeId:
     chamber: Chamber
     name: str
+    # Derived once in __post_init__. Names compare case-insensitively, so the folded
+    # name is interned and the sort key is built from it up front. The sort key holds
+    # exactly the fields __eq__ compares (subclasses included), so it doubles as the
+    # hash input and no subclass needs its own __hash__.
+    _name_lower: str = field(init=False, repr=False, compare=False)
+    _hash: int = field(init=False, repr=False, compare=False)
+    _sort_key: Tuple = field(init=False, repr=False, compare=False)
+    _str: str = field(init=False, repr=False, compare=False)
 
-    model_config = {
-        "validate_assignment": True,
-        "frozen": True,
-    }
-
-    @field_validator("name")
-    @classmethod
-    def _validate_name(cls, value: str) -> str:
-        if value is None:
+    def __post_init__(self):
+        if self.name is None:
             raise ValueError("Committee name cannot be None")
-        cleaned = value.strip()
+        cleaned = self.name.strip()
         if not cleaned:
             raise ValueError("Committee name cannot be empty")
-        return cleaned
-
-    @field_validator("chamber")
-    @classmethod
-    def _validate_chamber(cls, value: Optional[Chamber]) -> Chamber:
-        if value is None:
+        if self.chamber is None:
             raise ValueError("Committee chamber cannot be None")
-        return value
+        object.__setattr__(self, "name", cleaned)
+        object.__setattr__(self, "_name_lower", sys.intern(cleaned.lower()))
+        object.__setattr__(self, "_sort_key", self.sort_key())
+        object.__setattr__(self, "_hash", hash(self._sort_key))
+        object.__setattr__(self, "_str", f"{self.chamber}-{self.name}")
 
     def __str__(self) -> str:
-        return f"{self.chamber}-{self.name}"
+        return self._str
 
     def __repr__(self) -> str:
         return f"CommitteeId(chamber={self.chamber!r}, name={self.name!r})"
@@ -46,15 +50,53 @@ class CommitteeId(BaseModel):
             return NotImplemented
         return (
             self.chamber == other.chamber
-            and self.name.lower() == other.name.lower()
+            and self._name_lower == other._name_lower
         )
 
     def __hash__(self) -> int:
-        return hash((self.chamber, self.name.lower()))
+        return self._hash
+
+    def sort_key(self) -> Tuple:
+        """Ordering key; subclasses extend it with their own fields."""
+        return self.chamber.name, self._name_lower
 
+    # Ordering compares the cached key tuples, so each comparison is a single C-level
+    # tuple compare rather than a chain of branches per subclass.
     def __lt__(self, other: "CommitteeId") -> bool:
         if not isinstance(other, CommitteeId):
             return NotImplemented
-        if self.chamber.name != other.chamber.name:
-            return self.chamber.name < other.chamber.name
-        return self.name.lower() < other.name.lower()
+        return self._sort_key < other._sort_key
+
+    def __le__(self, other: "CommitteeId") -> bool:
+        if not isinstance(other, CommitteeId):
+            return NotImplemented
+        return self._sort_key <= other._sort_key
+
+    def __gt__(self, other: "CommitteeId") -> bool:
+        if not isinstance(other, CommitteeId):
+            return NotImplemented
+        return self._sort_key > other._sort_key
+
+    def __ge__(self, other: "CommitteeId") -> bool:
+        if not isinstance(other, CommitteeId):
+            return NotImplemented
+        return self._sort_key >= other._sort_key
+
+    def to_key(self) -> str:
+        """String form used for JSON map keys, e.g. SENATE-Finance; from_key reads it back."""
+        return f"{self.chamber.name}-{self.name}"
+
+    @classmethod
+    def from_key(cls, key: str) -> "CommitteeId":
+        chamber, _, name = key.partition("-")
+        return cls(Chamber.get_value(chamber), name)
+
+
+def _committee_id_from_key(value):
+    return CommitteeId.from_key(value) if isinstance(value, str) else value
+
+
+# Key type for pydantic maps keyed by committee. JSON object keys must be strings,
+# so the key is written with to_key and parsed back with from_key.
+CommitteeIdKey = Annotated[CommitteeId, BeforeValidator(_committee_id_from_key),
+                           PlainSerializer(CommitteeId.to_key, return_type=str, when_used='json')]
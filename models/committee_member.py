@@ -11,11 +11,6 @@ class CommitteeMember(BaseModel):
     title: Optional[CommitteeMemberTitle] = None
     majority: bool = False
 
-    def __init__(self, sequence_no: int = 0, session_member: SessionMember = None,
-                 title: CommitteeMemberTitle = None, majority: bool = False, **data):
-        super().__init__(sequence_no=sequence_no, session_member=session_member,
-                        title=title, majority=majority, **data)
-
     def __eq__(self, other):
         if not isinstance(other, CommitteeMember):
             return False
@@ -63,4 +58,4 @@ class CommitteeMember(BaseModel):
         return self.majority
 
     def set_majority(self, majority: bool):
-        self.majority = majority
\ No newline at end of file
+        self.majority = majority
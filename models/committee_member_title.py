@@ -1,4 +1,5 @@
 from enum import Enum
+from typing import Dict
 
 class CommitteeMemberTitle(Enum):
     CHAIR_PERSON = "CHAIR_PERSON"
@@ -10,4 +11,10 @@ class CommitteeMemberTitle(Enum):
 
     @staticmethod
     def value_of_sql_enum(sql_enum: str) -> 'CommitteeMemberTitle':
-        return CommitteeMemberTitle(sql_enum.upper())
\ No newline at end of file
+        title = _TITLES_BY_VALUE.get(sql_enum.upper())
+        if title is None:
+            raise ValueError(f"{sql_enum!r} is not a valid CommitteeMemberTitle")
+        return title
+
+
+_TITLES_BY_VALUE: Dict[str, CommitteeMemberTitle] = {title.value: title for title in CommitteeMemberTitle}
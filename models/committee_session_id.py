@@ -1,37 +1,33 @@
-from pydantic import BaseModel
-from typing import Optional
+from dataclasses import dataclass
+from typing import Optional, Tuple
 
 from .committee_id import CommitteeId
 from .session_year import SessionYear
 
+# Slotted dataclasses break zero-argument super(), so the base methods are called
+# explicitly throughout.
+@dataclass(frozen=True, slots=True, eq=False)
 class CommitteeSessionId(CommitteeId):
     session: Optional[SessionYear] = None
 
-    def __init__(self, chamber=None, name: str = None, session: SessionYear = None, **data):
-        super().__init__(chamber=chamber, name=name, **data)
-        self.session = session
-
     def __str__(self):
-        return f"{super().__str__()}-{self.session}"
+        return f"{CommitteeId.__str__(self)}-{self.session}"
 
     def __eq__(self, other):
         if self is other:
             return True
         if not isinstance(other, CommitteeSessionId):
             return False
-        if not super().__eq__(other):
+        if not CommitteeId.__eq__(self, other):
             return False
         return self.session == other.session
 
-    def __hash__(self):
-        return 31 * super().__hash__() + (self.session.hashCode() if self.session else 0)
+    # Defining __eq__ would otherwise blank out the inherited hash.
+    __hash__ = CommitteeId.__hash__
 
-    def __lt__(self, other: CommitteeId):
-        super_result = super().__lt__(other)
-        if super_result == 0 and isinstance(other, CommitteeSessionId):
-            return self.session < other.session if self.session and other.session else False
-        return super_result
+    def sort_key(self) -> Tuple:
+        return CommitteeId.sort_key(self) + (self.session.year if self.session else 0,)
 
     # Getters / Setters
     def get_session(self) -> Optional[SessionYear]:
-        return self.session
\ No newline at end of file
+        return self.session
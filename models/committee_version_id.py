@@ -1,42 +1,35 @@
-from pydantic import BaseModel
-from typing import Optional
+from dataclasses import dataclass
+from typing import Optional, Tuple
 from datetime import datetime
 
 from .committee_session_id import CommitteeSessionId
-from .committee_id import CommitteeId
-from .session_year import SessionYear
 
+@dataclass(frozen=True, slots=True, eq=False)
 class CommitteeVersionId(CommitteeSessionId):
     reference_date: Optional[datetime] = None
 
-    def __init__(self, chamber=None, name: str = None, session: SessionYear = None,
-                 reference_date: datetime = None, **data):
-        if reference_date is None:
+    def __post_init__(self):
+        if self.reference_date is None:
             raise ValueError("referenceDate cannot be null!")
-        super().__init__(chamber=chamber, name=name, session=session, **data)
-        self.reference_date = reference_date
+        CommitteeSessionId.__post_init__(self)
 
     def __str__(self):
-        return f"{super().__str__()}-{self.reference_date}"
+        return f"{CommitteeSessionId.__str__(self)}-{self.reference_date}"
 
     def __eq__(self, other):
         if self is other:
             return True
         if not isinstance(other, CommitteeVersionId):
             return False
-        if not super().__eq__(other):
+        if not CommitteeSessionId.__eq__(self, other):
             return False
         return self.reference_date == other.reference_date
 
-    def __hash__(self):
-        return 31 * super().__hash__() + (hash(self.reference_date) if self.reference_date else 0)
+    __hash__ = CommitteeSessionId.__hash__
 
-    def __lt__(self, other: CommitteeId):
-        super_result = super().__lt__(other)
-        if super_result == 0 and isinstance(other, CommitteeVersionId):
-            return self.reference_date < other.reference_date if self.reference_date and other.reference_date else False
-        return super_result
+    def sort_key(self) -> Tuple:
+        return CommitteeSessionId.sort_key(self) + (self.reference_date or datetime.min,)
 
     # Basic Getters/Setters
     def get_reference_date(self) -> Optional[datetime]:
-        return self.reference_date
\ No newline at end of file
+        return self.reference_date
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Optional, Set, List
+from typing import Dict, Optional, Set, List
 from datetime import date, time
 from enum import Enum
 from pydantic import BaseModel, Field
@@ -15,7 +15,12 @@ class HearingHostType(str, Enum):
 
     @staticmethod
     def to_type(type_str: str) -> "HearingHostType":
-        return HearingHostType(type_str.strip().replace(" ", "_").upper())
+        host_type = _HOST_TYPES_BY_VALUE.get(type_str.strip().replace(" ", "_").upper())
+        if host_type is None:
+            raise ValueError(f"{type_str!r} is not a valid HearingHostType")
+        return host_type
+
+_HOST_TYPES_BY_VALUE: Dict[str, HearingHostType] = {host_type.value: host_type for host_type in HearingHostType}
 
 class HearingId(BaseModel):
     id: int
@@ -25,6 +30,8 @@ class HearingId(BaseModel):
         return self.id == other.id
     def __lt__(self, other):
         return self.id < other.id
+    def __hash__(self):
+        return hash(self.id)
 
 class HearingHost(BaseModel):
     chamber: str  # Should match Chamber enum from committee domain
@@ -32,8 +39,6 @@ class HearingHost(BaseModel):
     name: str
     @staticmethod
     def standardize_name(name: str) -> str:
-        import re
-        IRRELEVANT_TEXT = r"^(\s?(ON|FOR|THE|AND|,))+|((,|THE|AND|;)\s?)+$"
         return (
             name.upper().replace("  ", " ").replace(", AND", " AND")
             .replace(" &", " AND").strip()
@@ -48,8 +53,10 @@ class HearingHost(BaseModel):
             return hosts
         type_enum = HearingHostType.to_type(type_str)
         standardized_text = HearingHost.standardize_name(raw_name)
+        # type_enum and the names are already validated/standardized above, so skip
+        # pydantic validation per host.
         for host_text in standardized_text.split(";"):
-            hosts.append(HearingHost(chamber=chamber, type=type_enum, name=host_text.strip()))
+            hosts.append(HearingHost.model_construct(chamber=chamber, type=type_enum, name=host_text.strip()))
         return hosts
 
 # --- Main Model ---
@@ -66,22 +73,26 @@ class Hearing(BaseModel):
     hosts: Optional[Set[HearingHost]] = None
     session_year: int = Field(..., description="Year of the hearing")
 
+    # The transcript text can run to megabytes, so it is compared last and kept out
+    # of the hash. id and filename identify a hearing; equal hearings share both.
     def __eq__(self, other):
+        if self is other:
+            return True
         if not isinstance(other, Hearing):
             return False
         return (
             self.id == other.id and
             self.filename == other.filename and
-            self.text == other.text and
-            self.title == other.title and
-            self.address == other.address and
             self.date == other.date and
             self.start_time == other.start_time and
             self.end_time == other.end_time and
-            self.hosts == other.hosts
+            self.title == other.title and
+            self.address == other.address and
+            self.hosts == other.hosts and
+            self.text == other.text
         )
     def __hash__(self):
-        return hash((self.id, self.filename, self.text, self.title, self.address, self.date, self.start_time, self.end_time, tuple(self.hosts) if self.hosts else None))
+        return hash((self.id, self.filename))
 
 # --- Exceptions ---
 
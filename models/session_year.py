@@ -1,8 +1,14 @@
-from pydantic import BaseModel, validator
+from pydantic import BaseModel, ConfigDict, validator
 from datetime import datetime, date
-from typing import Optional
+from typing import Dict, Optional
+
+# Shared instances handed out by SessionYear.of, keyed on both the requested year and
+# the computed session year. Only a few dozen sessions exist, so this never needs pruning.
+_POOL: Dict[int, 'SessionYear'] = {}
 
 class SessionYear(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     year: int
 
     @validator('year', pre=True)
@@ -15,14 +21,19 @@ class SessionYear(BaseModel):
         return v
 
     def previous_session_year(self) -> 'SessionYear':
-        return SessionYear(year=self.year - 2)
+        return SessionYear.of(self.year - 2)
 
     def next_session_year(self) -> 'SessionYear':
-        return SessionYear(year=self.year + 2)
+        return SessionYear.of(self.year + 2)
 
     @classmethod
     def of(cls, year: int) -> 'SessionYear':
-        return cls(year=year)
+        session = _POOL.get(year)
+        if session is None:
+            session = cls(year=year)
+            session = _POOL.setdefault(session.year, session)
+            _POOL[year] = session
+        return session
 
     @classmethod
     def current(cls) -> 'SessionYear':
@@ -41,4 +52,4 @@ class SessionYear(BaseModel):
         return isinstance(other, SessionYear) and self.year == other.year
 
     def __hash__(self):
-        return hash(self.year)
\ No newline at end of file
+        return hash(self.year)
@@ -1,9 +1,12 @@
 from __future__ import annotations
-from typing import Optional, Set
+from typing import Any, ClassVar, Optional, Set
 from datetime import datetime, date, time
 from enum import Enum
 import re
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+_TIME_STAMP_RE = re.compile(r'\d{1,2}:\d{1,2}')
+_SPEAKER_NOISE_RE = re.compile(r'^ *\d* *|:')
 
 # --- Enums and Value Objects ---
 
@@ -16,11 +19,11 @@ class DayType(str, Enum):
         speakers: Set[str] = set()
         for line in transcript_text.splitlines():
             # Remove time stamps and "The order of business:"
-            line = re.sub(r'\d{1,2}:\d{1,2}', '', line)
+            line = _TIME_STAMP_RE.sub('', line)
             line = line.replace("The order of business:", "")
             if ":" in line:
                 # Isolate speaker names
-                speaker = re.sub(r'^ *\d* *|:', '', line).strip().upper()
+                speaker = _SPEAKER_NOISE_RE.sub('', line).strip().upper()
                 speakers.add(speaker)
         # Legislative days only have the Secretary and President speaking.
         if len(speakers) == 2:
@@ -58,7 +61,7 @@ class SessionType:
     def _numeral_to_int(numeral: str) -> int:
         # Simple numeral to int conversion
         roman = {"I": 1, "II": 2, "III": 3, "IV": 4, "V": 5, "VI": 6, "VII": 7, "VIII": 8, "IX": 9, "X": 10}
-        return roman.get(numeral, int(numeral))
+        return roman[numeral] if numeral in roman else int(numeral)
 
     def __str__(self) -> str:
         return self._type_string
@@ -75,12 +78,16 @@ class SessionType:
         return hash(self._type_string)
 
     def _compare_to(self, other: "SessionType") -> int:
+        a, b = self._type_string, other._type_string
         # Regular sessions come first
-        if self._type_string.startswith(self._regular) or other._type_string.startswith(self._regular):
-            return other._type_string.__cmp__(self._type_string)  # Python 3 doesn't have __cmp__, use comparison
-        return self._type_string.__cmp__(other._type_string)
+        if a.startswith(self._regular) or b.startswith(self._regular):
+            a, b = b, a
+        return (a > b) - (a < b)
 
 class TranscriptId(BaseModel):
+    # SessionType is a plain class, checked with isinstance
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     date_time: datetime
     session_type: SessionType
 
@@ -117,26 +124,28 @@ class HearingHostType(str, Enum):
     MAJORITY_COALITION = "MAJORITY COALITION"
     WHOLE_CHAMBER = "WHOLE CHAMBER"
 
-    _type_labels = "|".join([e.value for e in HearingHostType])
-    _committee_label = r"(STANDING\s*)?(SUB)?" + HearingHostType.COMMITTEE.value + r"(S)?"
-    _coalition_and_task_force = HearingHostType.MAJORITY_COALITION.value + r"\sJOINT " + HearingHostType.TASK_FORCE.value
-
     @classmethod
     def to_type(cls, type_str: str) -> "HearingHostType":
         return cls(type_str.strip().replace(" ", "_").upper())
 
     @classmethod
     def standardize_host_block(cls, block: str) -> str:
-        block = re.sub(cls._committee_label, HearingHostType.COMMITTEE.value, block)
+        block = _COMMITTEE_LABEL_RE.sub(HearingHostType.COMMITTEE.value, block)
         # The parser can't handle the multiple types that some hearings have.
-        return re.sub(cls._coalition_and_task_force, HearingHostType.TASK_FORCE.value, block)
+        return _COALITION_AND_TASK_FORCE_RE.sub(HearingHostType.TASK_FORCE.value, block)
+
+# Built after the class: an Enum body cannot refer to its own members, and any
+# other attribute defined there would become a member itself.
+_COMMITTEE_LABEL_RE = re.compile(r"(STANDING\s*)?(SUB)?" + HearingHostType.COMMITTEE.value + r"(S)?")
+_COALITION_AND_TASK_FORCE_RE = re.compile(
+    HearingHostType.MAJORITY_COALITION.value + r"\sJOINT " + HearingHostType.TASK_FORCE.value)
 
 class HearingHost(BaseModel):
     chamber: Chamber
     type: HearingHostType
     name: str
 
-    _irrelevant_text = r"^(\s?(ON|FOR|THE|AND|,))+|((,|THE|AND|;)\s?)+$"
+    _irrelevant_text: ClassVar[str] = r"^(\s?(ON|FOR|THE|AND|,))+|((,|THE|AND|;)\s?)+$"
 
     def __init__(self, **data):
         super().__init__(**data)
@@ -155,8 +164,10 @@ class HearingHost(BaseModel):
         # When there is a list of committees, sometimes only the first is marked as a committee,
         # and the names are separated by semicolons.
         host_texts = standardized_text.split(";")
+        # The whole text was standardized above, so build each host without
+        # re-validating it or re-running _standardize_name in __init__.
         for host_text in host_texts:
-            host = cls(chamber=chamber, type=type_, name=host_text)
+            host = cls.model_construct(chamber=chamber, type=type_, name=host_text.strip())
             hosts.append(host)
         return hosts
 
@@ -196,14 +207,15 @@ class Transcript(BaseModel):
         if self.day_type is None:
             raise ValueError("dayType cannot be null")
 
-    @validator("session_year", pre=True, always=True)
-    def set_session_year(cls, v, values):
-        if v is not None:
-            return v
-        id_ = values.get("id")
-        if id_ and hasattr(id_, "date_time"):
-            return id_.date_time.year
-        return None
+    @model_validator(mode='before')
+    @classmethod
+    def set_session_year(cls, data: Any) -> Any:
+        # session_year is required, so it has to be filled in before validation.
+        if isinstance(data, dict) and data.get("session_year") is None:
+            id_ = data.get("id")
+            if isinstance(id_, TranscriptId):
+                data = {**data, "session_year": id_.date_time.year}
+        return data
 
     def get_id(self) -> TranscriptId:
         return self.id
@@ -291,6 +303,9 @@ class Hearing(BaseModel):
     def get_filename(self) -> str:
         return self.filename
 
+    # Same contract as models/hearing.py: the text is compared last and kept out of
+    # the hash, and hosts is a set, which cannot be hashed. Equal hearings share
+    # id and filename.
     def __eq__(self, other) -> bool:
         if self is other:
             return True
@@ -299,29 +314,23 @@ class Hearing(BaseModel):
         return (
             self.id == other.id and
             self.filename == other.filename and
-            self.text == other.text and
-            self.title == other.title and
-            self.address == other.address and
             self.date == other.date and
             self.start_time == other.start_time and
             self.end_time == other.end_time and
-            self.hosts == other.hosts
+            self.title == other.title and
+            self.address == other.address and
+            self.hosts == other.hosts and
+            self.text == other.text
         )
 
     def __hash__(self) -> int:
-        return hash((self.id, self.filename, self.text, self.title, self.address, self.date, self.start_time, self.end_time, self.hosts))
+        return hash((self.id, self.filename))
 
 # --- Exceptions ---
 
-class TranscriptNotFoundEx(Exception):
-    pass
-
 class HearingNotFoundEx(Exception):
     pass
 
-class DuplicateTranscriptEx(Exception):
-    pass
-
 class TranscriptNotFoundEx(Exception):
     def __init__(self, transcript_id: Optional[TranscriptId], ex: Optional[Exception] = None):
         msg = (
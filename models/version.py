@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import List
+from typing import Dict, List
 
 class Version(str, Enum):
     ORIGINAL = ""
@@ -35,15 +35,24 @@ class Version(str, Enum):
         clean_version = (version or "").strip().upper()
         if not clean_version or clean_version == "DEFAULT":
             return cls.ORIGINAL
-        return cls(clean_version)
+        version = _VERSIONS_BY_VALUE.get(clean_version)
+        if version is None:
+            raise ValueError(f"{clean_version!r} is not a valid {cls.__name__}")
+        return version
 
     @classmethod
     def before(cls, v: 'Version') -> List['Version']:
-        return [ver for ver in cls if ver.value < v.value]
+        return _VERSION_ORDER[:_VERSION_INDEX[v]]
 
     @classmethod
     def after(cls, v: 'Version') -> List['Version']:
-        return [ver for ver in cls if ver.value > v.value]
+        return _VERSION_ORDER[_VERSION_INDEX[v] + 1:]
 
     def __str__(self):
-        return self.value
\ No newline at end of file
+        return self.value
+
+
+_VERSIONS_BY_VALUE: Dict[str, Version] = {version.value: version for version in Version}
+# Members are declared in value order, so before/after are slices by position.
+_VERSION_ORDER: List[Version] = list(Version)
+_VERSION_INDEX: Dict[Version, int] = {version: i for i, version in enumerate(_VERSION_ORDER)}
@@ -0,0 +1,42 @@
+# tools/testing/tests/test_agenda_vote_action.py
+import pytest
+
+from models.agenda_vote_action import AgendaVoteAction
+
+
+class TestAgendaVoteActionLookup:
+    """Tests for looking up vote actions by code"""
+
+    def test_value_of_code(self):
+        """Codes map to their action regardless of case and surrounding spaces"""
+        assert AgendaVoteAction.value_of_code("R") is AgendaVoteAction.REPORTED
+        assert AgendaVoteAction.value_of_code(" rc ") is AgendaVoteAction.REFERRED_TO_COMMITTEE
+        assert AgendaVoteAction.value_of_code("3") is AgendaVoteAction.THIRD_READING
+
+    def test_every_action_reachable_from_its_code(self):
+        """Each action is returned for its own code"""
+        for action in AgendaVoteAction:
+            assert AgendaVoteAction.value_of_code(action.get_code) is action
+
+    def test_unknown_code(self):
+        """An unknown code returns None and a missing code raises ValueError"""
+        assert AgendaVoteAction.value_of_code("X") is None
+        with pytest.raises(ValueError):
+            AgendaVoteAction.value_of_code(None)
+
+
+class TestAgendaVoteActionValue:
+    """Tests for the str-valued enum"""
+
+    def test_members_are_their_codes(self):
+        """Each action is a str equal to its code"""
+        assert isinstance(AgendaVoteAction.REPORTED, str)
+        assert AgendaVoteAction.REPORTED == "R"
+        assert AgendaVoteAction.RESTORED_TO_THIRD.value == "R3"
+        assert AgendaVoteAction.SPECIAL.get_code == "S"
+
+    def test_constructed_from_code(self):
+        """Calling the enum with a code returns the member, and unknown codes raise ValueError"""
+        assert AgendaVoteAction("F") is AgendaVoteAction.FIRST_READING
+        with pytest.raises(ValueError):
+            AgendaVoteAction("X")
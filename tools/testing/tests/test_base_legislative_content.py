@@ -0,0 +1,25 @@
+# tools/testing/tests/test_base_legislative_content.py
+import pytest
+from pydantic import ValidationError
+
+from models.agenda_info_addendum import AgendaInfoAddendum
+from models.base_legislative_content import BaseLegislativeContent
+
+
+class TestExtraFields:
+    """Tests for rejecting unknown fields"""
+
+    def test_unknown_field_rejected(self):
+        """An unknown field fails validation instead of being stored"""
+        with pytest.raises(ValidationError, match="extra_forbidden"):
+            BaseLegislativeContent(year=2023, unknown_field="x")
+
+    def test_unknown_field_rejected_on_subclasses(self):
+        """Subclasses inherit the setting"""
+        with pytest.raises(ValidationError, match="extra_forbidden"):
+            AgendaInfoAddendum(id="", committees={})
+
+    def test_known_fields_accepted(self):
+        """Declared fields still validate, and the session is derived from the year"""
+        content = BaseLegislativeContent(year=2023)
+        assert content.get_session().year == 2023
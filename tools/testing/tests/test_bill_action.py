@@ -0,0 +1,93 @@
+# tools/testing/tests/test_bill_action.py
+import dataclasses
+from datetime import date
+
+import pytest
+
+from models.bill_action import BillAction
+from models.bill_id import BillId
+from models.chamber import Chamber
+
+
+def _action(text="REFERRED TO FINANCE", sequence_no=1, print_no="S1", **fields):
+    fields.setdefault("date", date(2023, 1, 4))
+    fields.setdefault("chamber", Chamber.SENATE)
+    return BillAction(bill_id=BillId(print_no=print_no, session=2023), sequence_no=sequence_no,
+                      text=text, **fields)
+
+
+class TestBillActionHash:
+    """Tests for BillAction equality and the precomputed hash"""
+
+    def test_equal_actions_hash_alike(self):
+        """Actions with the same fields are equal and hash the same"""
+        assert _action() == _action()
+        assert hash(_action()) == hash(_action())
+        assert len({_action(), _action(), _action(sequence_no=2)}) == 2
+
+    def test_every_field_takes_part(self):
+        """Changing any field breaks equality"""
+        base = _action()
+        assert base != _action(sequence_no=2)
+        assert base != _action(date=date(2023, 1, 5))
+        assert base != _action(chamber=Chamber.ASSEMBLY)
+        assert base != _action(action_type="REFERRAL")
+        assert base != _action(text="referred to finance")
+        assert base != _action(print_no="S1A")
+
+    def test_missing_values_default(self):
+        """A missing text or sequence no is filled in, and a bill id is required"""
+        action = _action(text=None, sequence_no=None)
+        assert action.text == "" and action.sequence_no == 0
+        assert hash(action) == hash(_action(text="", sequence_no=0))
+        with pytest.raises(ValueError):
+            BillAction(bill_id=None, date=None, chamber=None, sequence_no=1, text="")
+
+    def test_frozen(self):
+        """Actions cannot be modified, so the precomputed hash stays valid"""
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            _action().text = "OTHER"
+
+    def test_ordering_by_sequence_no(self):
+        """Actions order by sequence number"""
+        actions = [_action(sequence_no=3), _action(sequence_no=1), _action(sequence_no=2)]
+        assert [action.sequence_no for action in sorted(actions)] == [1, 2, 3]
+        assert _action(sequence_no=1) <= _action(sequence_no=1, text="OTHER")
+
+
+class TestBillActionEqualsBase:
+    """Tests for equals_base and the folded text"""
+
+    def test_text_compares_case_insensitively(self):
+        """equals_base ignores the case of the action text"""
+        assert _action(text="Referred To Finance").equals_base(_action(text="REFERRED TO FINANCE"))
+        assert not _action(text="REFERRED TO RULES").equals_base(_action(text="REFERRED TO FINANCE"))
+
+    def test_folded_text_is_shared(self):
+        """Actions with the same text share one interned folded string"""
+        first = _action(text="".join(["Passed ", "Senate"]))
+        second = _action(text="PASSED SENATE")
+        assert first._text_fold is second._text_fold
+
+    def test_ignores_bill_version(self):
+        """Actions on different amendments of the same bill match"""
+        assert _action(print_no="S1A").equals_base(_action(print_no="S1"))
+        assert not _action(print_no="S2").equals_base(_action(print_no="S1"))
+
+    def test_missing_date_and_chamber_default(self):
+        """A missing date or chamber matches its default"""
+        assert _action(date=None, chamber=None).equals_base(_action(date=date.min, chamber=Chamber.SENATE))
+        assert not _action(chamber=Chamber.ASSEMBLY).equals_base(_action(chamber=None))
+
+    def test_cheapest_first_eq_matches_field_comparison(self):
+        """__eq__ agrees with comparing all fields as tuples"""
+        fields = ("bill_id", "date", "chamber", "sequence_no", "text", "action_type")
+        actions = [_action(), _action(sequence_no=2), _action(text="OTHER"), _action(print_no="S1A")]
+        for a in actions:
+            for b in actions:
+                assert (a == b) == (tuple(getattr(a, f) for f in fields) == tuple(getattr(b, f) for f in fields))
+
+    def test_not_equal_to_other_types(self):
+        """Comparing with a non-action is simply unequal"""
+        assert _action() != "REFERRED TO FINANCE"
+        assert not _action().equals_base("REFERRED TO FINANCE")
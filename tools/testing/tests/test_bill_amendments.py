@@ -0,0 +1,92 @@
+# tools/testing/tests/test_bill_amendments.py
+import pytest
+
+from models.base_bill_id import BaseBillId
+from models.bill import Bill, BillAmendment, BillTextFormat
+from models.bill_id import BillId
+from models.version import Version
+
+
+@pytest.fixture
+def bill():
+    bill = Bill(base_bill_id=BaseBillId(print_no="S1", session=2023))
+    bill.add_amendment(BillAmendment(bill_id=BillId(print_no="S1", session=2023), version=Version.ORIGINAL))
+    return bill
+
+
+def _amendment(version):
+    return BillAmendment(bill_id=BillId(print_no="S1" + version.value, session=2023), version=version)
+
+
+class TestBillAmendmentViews:
+    """Tests for the amendment list and id views"""
+
+    def test_views_follow_add_amendment(self, bill):
+        """Added amendments show up in both views"""
+        bill.get_amendment_list()
+        bill.add_amendment(_amendment(Version.A))
+        assert [a.version for a in bill.get_amendment_list()] == [Version.ORIGINAL, Version.A]
+        assert bill.get_amendment_ids() == {BillId(print_no="S1", session=2023),
+                                            BillId(print_no="S1A", session=2023)}
+
+    def test_views_follow_amendment_map_assignment(self, bill):
+        """Reassigning amendment_map replaces the views"""
+        bill.get_amendment_list()
+        bill.get_amendment_ids()
+        bill.amendment_map = {Version.B: _amendment(Version.B)}
+        assert [a.version for a in bill.get_amendment_list()] == [Version.B]
+        assert bill.get_amendment_ids() == {BillId(print_no="S1B", session=2023)}
+
+    def test_views_follow_in_place_map_edits(self, bill):
+        """Edits to the dict from get_amendment_map show up in the views"""
+        bill.get_amendment_list()
+        bill.get_amendment_ids()
+        bill.get_amendment_map()[Version.A] = _amendment(Version.A)
+        assert len(bill.get_amendment_list()) == 2
+        assert BillId(print_no="S1A", session=2023) in bill.get_amendment_ids()
+
+    def test_views_follow_model_copy_with_update(self, bill):
+        """A copy with a new amendment_map does not keep the original's views"""
+        bill.get_amendment_list()
+        copied = bill.model_copy(update={"amendment_map": {Version.A: _amendment(Version.A)}})
+        assert [a.version for a in copied.get_amendment_list()] == [Version.A]
+
+    def test_shallow_clone_copies_amendments(self, bill):
+        """shallow_clone carries every amendment over"""
+        bill.add_amendment(_amendment(Version.A))
+        bill.get_amendment_list()
+        clone = bill.shallow_clone()
+        assert clone.get_amendment_list() == bill.get_amendment_list()
+        assert clone.get_amendment_ids() == bill.get_amendment_ids()
+
+
+class TestBillTextFormats:
+    """Tests for reading amendment text by format"""
+
+    @pytest.fixture
+    def amendment(self):
+        return BillAmendment(bill_id=BillId(print_no="S1", session=2023), version=Version.ORIGINAL,
+                             full_texts=("plain text", "<pre>html text</pre>", "template text"))
+
+    @pytest.mark.parametrize("fmt, text", [(BillTextFormat.PLAIN, "plain text"),
+                                           (BillTextFormat.HTML, "<pre>html text</pre>"),
+                                           (BillTextFormat.TEMPLATE, "template text")])
+    def test_get_full_text_by_format(self, amendment, fmt, text):
+        """Each format returns its own entry in full_texts"""
+        assert amendment.get_full_text(fmt) == text
+
+    def test_texts_default_to_empty(self):
+        """An amendment without text returns an empty string for every format"""
+        amendment = BillAmendment(bill_id=BillId(print_no="S1", session=2023), version=Version.ORIGINAL)
+        assert [amendment.get_full_text(fmt) for fmt in BillTextFormat] == ["", "", ""]
+
+    def test_full_text_plain_reads_active_amendment(self, bill, amendment):
+        """Bill.get_full_text_plain returns the active amendment's plain text"""
+        bill.add_amendment(amendment)
+        assert bill.get_full_text_plain() == "plain text"
+        bill.active_version = Version.B
+        assert bill.get_full_text_plain() == ""
+
+    def test_shallow_clone_keeps_texts(self, amendment):
+        """A cloned amendment keeps every format's text"""
+        assert amendment.shallow_clone().full_texts == amendment.full_texts
@@ -0,0 +1,74 @@
+# tools/testing/tests/test_bill_column_store.py
+from datetime import datetime
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from models.base_bill_id import BaseBillId
+from models.bill import Bill, BillAmendment, PublishStatus
+from models.bill_column_store import BillColumnStore
+from models.version import Version
+
+
+def _bill(print_no, effect_date_time=None, **fields):
+    bill = Bill(base_bill_id=BaseBillId(print_no=print_no, session=2023), **fields)
+    bill.add_amendment(BillAmendment(bill_id=bill.base_bill_id, version=Version.ORIGINAL))
+    if effect_date_time is not None:
+        bill.update_publish_status(Version.ORIGINAL, PublishStatus(effect_date_time=effect_date_time))
+    return bill
+
+
+@pytest.fixture
+def bills():
+    no_amendment = Bill(base_bill_id=BaseBillId(print_no="K7", session=2023))
+    return [
+        _bill("S5", datetime(2023, 3, 1), title="First", chapter_num=12, chapter_year=2023),
+        _bill("A12345", datetime(2010, 1, 1), title="Old", federal_congress=118),
+        _bill("J300"),
+        no_amendment,
+    ]
+
+
+class TestBillColumnStore:
+    """Tests for the columnar Bill snapshot"""
+
+    def test_columns(self, bills):
+        """Each scalar field becomes one column, with -1 for missing ints"""
+        store = BillColumnStore.from_bills(bills)
+        assert len(store) == 4
+        assert store.base_bill_ids == [bill.base_bill_id for bill in bills]
+        assert store.titles.tolist() == ["First", "Old", "", ""]
+        assert store.chapter_nums.tolist() == [12, -1, -1, -1]
+        assert store.chapter_years.tolist() == [2023, -1, -1, -1]
+        assert store.federal_congresses.tolist() == [-1, 118, -1, -1]
+        assert store.designators.tolist() == ["S", "A", "J", "K"]
+        assert store.numbers.tolist() == [5, 12345, 300, 7]
+
+    def test_iter_views_restores_none(self, bills):
+        """Views map the missing marker back to None"""
+        views = list(BillColumnStore.from_bills(bills).iter_views())
+        assert views[0].chapter_num == 12
+        assert views[1].chapter_num is None
+        assert views[1].federal_congress == 118
+        assert views[0].active_version == Version.ORIGINAL
+        assert views[0].base_bill_id is bills[0].base_bill_id
+
+    def test_valid_laws_mask_matches_bill(self, bills):
+        """The mask agrees with Bill.has_valid_laws row by row"""
+        mask = BillColumnStore.from_bills(bills).valid_laws_mask()
+        assert mask.tolist() == [True, False, False, False]
+        assert mask.tolist() == [bill.has_valid_laws(bill.active_version) for bill in bills]
+
+    def test_padded_print_numbers_match_bill_ids(self, bills):
+        """The padded column agrees with BaseBillId.padded_print_number"""
+        padded = BillColumnStore.from_bills(bills).padded_print_numbers()
+        assert padded.tolist() == ["S00005", "A12345", "J00300", "K00007"]
+        assert padded.tolist() == [bill.base_bill_id.padded_print_number for bill in bills]
+
+    def test_empty(self):
+        """An empty bill list gives empty columns"""
+        store = BillColumnStore.from_bills([])
+        assert len(store) == 0
+        assert store.valid_laws_mask().tolist() == []
+        assert store.padded_print_numbers().tolist() == []
@@ -0,0 +1,156 @@
+# tools/testing/tests/test_bill_id.py
+import pytest
+
+from models.base_bill_id import BaseBillId
+from models.bill_id import BillId
+from models.session_year import SessionYear
+from models.version import Version
+
+
+class TestSessionYearPool:
+    """Tests for the shared SessionYear instances"""
+
+    def test_of_returns_shared_instance(self):
+        """SessionYear.of hands out one instance per session"""
+        assert SessionYear.of(2023) is SessionYear.of(2023)
+
+    def test_of_pools_by_requested_and_computed_year(self):
+        """An even year resolves to the same instance as its session year"""
+        assert SessionYear.of(2024) is SessionYear.of(2023)
+        assert SessionYear.of(2024).year == 2023
+
+    def test_next_and_previous_use_pool(self):
+        """next/previous session years come from the pool"""
+        session = SessionYear.of(2023)
+        assert session.next_session_year() is SessionYear.of(2025)
+        assert session.previous_session_year() is SessionYear.of(2021)
+
+
+class TestBillIdPool:
+    """Tests for BillId.get pooling"""
+
+    def test_get_returns_shared_instance(self):
+        """Equal keys share one BillId"""
+        session = SessionYear.of(2023)
+        assert BillId.get(session, "S1234", Version.A) is BillId.get(session, "S1234", Version.A)
+
+    def test_get_matches_validated_id(self):
+        """Pooled ids compare and hash like validated ones"""
+        pooled = BillId.get(SessionYear.of(2023), "S1234", Version.A)
+        parsed = BillId(print_no="S1234A", session=2023)
+        assert pooled == parsed
+        assert hash(pooled) == hash(parsed)
+        assert pooled.print_no == "S1234A"
+
+    def test_get_keys_on_class(self):
+        """A BaseBillId is never handed out for a BillId key"""
+        session = SessionYear.of(2023)
+        base = BaseBillId.get(session, "S1234")
+        assert type(base) is BaseBillId
+        assert type(BillId.get(session, "S1234")) is BillId
+
+    def test_with_version_uses_pool(self):
+        """with_version returns the pooled id for the new version"""
+        bill_id = BillId(print_no="S1234", session=2023)
+        assert bill_id.with_version(Version.B) is BillId.get(SessionYear.of(2023), "S1234", Version.B)
+
+    def test_get_coerces_str_version(self):
+        """A str version is parsed before it reaches the pool"""
+        session = SessionYear.of(2023)
+        bill_id = BillId.get(session, "S1234", "a")
+        assert bill_id.version is Version.A
+        assert bill_id is BillId.get(session, "S1234", Version.A)
+        assert bill_id.padded_print_number == "S01234A"
+
+    def test_with_version_coerces_str_version(self):
+        """with_version accepts a version string"""
+        bill_id = BillId(print_no="S1234", session=2023).with_version("B")
+        assert bill_id.version is Version.B
+        assert bill_id.print_no == "S1234B"
+        assert bill_id < BillId(print_no="S1234C", session=2023)
+
+    def test_get_rejects_invalid_version(self):
+        """An unknown version never enters the pool"""
+        with pytest.raises(ValueError):
+            BillId.get(SessionYear.of(2023), "S1234", "AB")
+
+
+class TestBillIdDerivedValues:
+    """Tests for the cached print no, number and padded forms"""
+
+    def test_derived_values(self):
+        """Derived strings come from the normalized print no"""
+        bill_id = BillId(print_no="s-0042b", session=2024)
+        assert bill_id.print_no == "S42B"
+        assert bill_id.number == 42
+        assert bill_id.padded_print_number == "S00042B"
+
+    def test_normalize_strips_leading_zeros(self):
+        """Leading zeros are dropped from the number but not from the version"""
+        assert BillId.normalize_print_no("S00120B") == "S120B"
+        assert BillId.normalize_print_no(" a-0042 ") == "A42"
+
+    def test_normalize_keeps_one_digit_for_all_zero_numbers(self):
+        """An all-zero number keeps a single 0, so the id still has a number"""
+        assert BillId.normalize_print_no("S000") == "S0"
+        bill_id = BillId(print_no="S000A", session=2023)
+        assert bill_id.base_print_no == "S0"
+        assert bill_id.version == Version.A
+        assert bill_id.number == 0
+        assert bill_id.padded_print_number == "S00000A"
+
+    def test_normalize_rejects_bad_print_nos(self):
+        """Print nos without a designator and digits are rejected"""
+        for print_no in ("", "X12", "S", "SA"):
+            with pytest.raises(ValueError):
+                BillId.normalize_print_no(print_no)
+
+    def test_model_copy_with_update_rederives(self):
+        """A copy with changed fields does not keep the original's cached values"""
+        original = BillId(print_no="S1234A", session=2023)
+        assert original.print_no == "S1234A"
+        hash(original)
+        copied = original.model_copy(update={"version": Version.B})
+        assert copied.print_no == "S1234B"
+        assert copied.padded_print_number == "S01234B"
+        assert copied == BillId(print_no="S1234B", session=2023)
+        assert hash(copied) == hash(BillId(print_no="S1234B", session=2023))
+        assert hash(copied) != hash(original)
+
+
+class TestBillIdOrdering:
+    """Tests for compare_to and the ordering operators"""
+
+    def test_compare_to(self):
+        """compare_to orders by session, then print no, then version"""
+        s1 = BillId(print_no="S1", session=2023)
+        s1a = BillId(print_no="S1A", session=2023)
+        s2 = BillId(print_no="S2", session=2021)
+        assert s1.compare_to(s1a) == -1
+        assert s1a.compare_to(s1) == 1
+        assert s1.compare_to(BillId(print_no="S1", session=2023)) == 0
+        assert s2.compare_to(s1) == -1
+
+    def test_operators_agree_with_compare_to(self):
+        """<, <=, > and >= are consistent with compare_to"""
+        low = BillId(print_no="A100", session=2023)
+        high = BillId(print_no="S100", session=2023)
+        assert low < high and low <= high
+        assert high > low and high >= low
+        assert low <= BillId(print_no="A100", session=2023)
+        assert not low > high
+
+    def test_sorted(self):
+        """Sorting uses the cached sort key"""
+        ids = [BillId(print_no=p, session=s) for p, s in [("S5", 2023), ("A7", 2023), ("S5A", 2023), ("S9", 2021)]]
+        assert [str(bill_id) for bill_id in sorted(ids)] == ["S9-2021", "A7-2023", "S5-2023", "S5A-2023"]
+
+    def test_base_and_versioned_ids_order_like_they_compare(self):
+        """A BaseBillId and the equal original-version BillId are neither less nor greater"""
+        base = BaseBillId(print_no="S1", session=2023)
+        original = BillId(print_no="S1", session=2023)
+        assert base == original and hash(base) == hash(original)
+        assert base.compare_to(original) == 0 and original.compare_to(base) == 0
+        assert not base < original and not original < base
+        assert base <= original and base >= original
+        assert base < BillId(print_no="S1A", session=2023)
@@ -0,0 +1,93 @@
+# tools/testing/tests/test_bill_loading.py
+import json
+
+import pytest
+
+from models.base_bill_id import BaseBillId
+from models.bill import Bill, BillAmendment
+from models.bill_id import BillId
+from models.version import Version
+
+
+class TestBillFromJson:
+    """Tests for parsing Bills from JSON feed records"""
+
+    def test_from_json_builds_validated_bill(self):
+        """A feed record becomes a Bill with its session year derived"""
+        raw = json.dumps({
+            "base_bill_id": {"print_no": "S1234", "session": 2023, "version": "A"},
+            "title": "An act",
+            "chapter_num": 5,
+            "chapter_year": 2023,
+        })
+        bill = Bill.from_json(raw)
+        assert bill.base_bill_id == BaseBillId(print_no="S1234", session=2023)
+        assert bill.base_bill_id.version == Version.ORIGINAL
+        assert bill.session_year == 2023
+        assert bill.title == "An act"
+        assert bill.chapter_num == 5
+
+    def test_from_json_accepts_bytes(self):
+        """orjson and json both accept bytes input"""
+        bill = Bill.from_json(b'{"base_bill_id": {"print_no": "A10", "session": 2024}}')
+        assert bill.base_bill_id.print_no == "A10"
+        assert bill.session_year == 2023
+
+    def test_from_json_validates_fields(self):
+        """Invalid feed values are rejected like any other Bill input"""
+        with pytest.raises(ValueError):
+            Bill.from_json('{"base_bill_id": {"print_no": "S1", "session": 2023}, "chapter_num": "x"}')
+
+
+class TestBillFromTrusted:
+    """Tests for building Bills from already-validated rows"""
+
+    def test_from_trusted_sets_session_year(self):
+        """session_year comes from the base bill id"""
+        bill = Bill.from_trusted({"base_bill_id": BaseBillId(print_no="S1", session=2024), "title": "t"})
+        assert bill.session_year == 2023
+        assert bill.title == "t"
+        assert bill.amendment_map == {}
+
+    def test_from_trusted_without_base_bill_id(self):
+        """An explicit session_year is kept, and a row with neither it nor a base id is rejected"""
+        assert Bill.from_trusted({"session_year": 2021, "title": "t"}).session_year == 2021
+        with pytest.raises(ValueError):
+            Bill.from_trusted({"title": "t"})
+
+    def test_from_trusted_coerces_amendment_rows(self):
+        """Plain amendment rows become BillAmendments"""
+        bill_id = BillId(print_no="S1A", session=2023)
+        bill = Bill.from_trusted({
+            "base_bill_id": BaseBillId(print_no="S1", session=2023),
+            "amendment_map": {Version.A: {"bill_id": bill_id, "version": Version.A}},
+            "active_version": Version.A,
+        })
+        amendment = bill.get_active_amendment()
+        assert isinstance(amendment, BillAmendment)
+        assert amendment.bill_id == bill_id
+        assert bill.has_amendment(Version.A)
+
+    def test_from_trusted_keeps_amendment_models(self):
+        """Existing BillAmendments are used as-is"""
+        amendment = BillAmendment(bill_id=BillId(print_no="S1", session=2023), version=Version.ORIGINAL)
+        bill = Bill.from_trusted({
+            "base_bill_id": BaseBillId(print_no="S1", session=2023),
+            "amendment_map": {Version.ORIGINAL: amendment},
+        })
+        assert bill.get_amendment(Version.ORIGINAL) is amendment
+
+
+class TestCongressToSessionYear:
+    """Tests for the congress number to session year lookup"""
+
+    @pytest.mark.parametrize("congress, year", [(1, 1789), (2, 1791), (117, 2021), (118, 2023), (119, 2025)])
+    def test_known_congresses(self, congress, year):
+        """Each supported congress maps to the first year of its session"""
+        assert Bill.congress_to_session_year(congress) == year
+
+    @pytest.mark.parametrize("congress", [0, -1, 120])
+    def test_unsupported_congresses(self, congress):
+        """Congress numbers outside the table raise ValueError"""
+        with pytest.raises(ValueError):
+            Bill.congress_to_session_year(congress)
@@ -0,0 +1,114 @@
+# tools/testing/tests/test_calendar_supplementals.py
+from datetime import date, datetime
+
+import pytest
+
+from models.calendar import Calendar, CalendarActiveList, CalendarSupplemental
+from models.calendar_id import CalendarId
+from models.version import Version
+
+
+def _supplemental(version, day):
+    return CalendarSupplemental(version=version, cal_date=date(2023, 3, day))
+
+
+@pytest.fixture
+def calendar():
+    return Calendar(calendar_id=CalendarId(year=2023, cal_no=10), session_year=2023)
+
+
+class TestCalendarSupplementals:
+    """Tests for the supplemental map and version ordering"""
+
+    def test_put_get_remove(self, calendar):
+        """Supplementals are stored and removed by version"""
+        supplemental = _supplemental(Version.A, 2)
+        calendar.put_supplemental(supplemental)
+        assert calendar.get_supplemental(Version.A) is supplemental
+        assert calendar.get_supplemental_map() == {Version.A: supplemental}
+        calendar.remove_supplemental(Version.A)
+        calendar.remove_supplemental(Version.B)
+        assert calendar.get_supplemental(Version.A) is None
+
+    def test_cal_date_uses_earliest_version(self, calendar):
+        """The calendar date comes from the lowest version, whatever the insertion order"""
+        calendar.put_supplemental(_supplemental(Version.B, 3))
+        calendar.put_supplemental(_supplemental(Version.ORIGINAL, 1))
+        calendar.put_supplemental(_supplemental(Version.A, 2))
+        assert calendar.get_cal_date() == date(2023, 3, 1)
+
+    def test_map_kept_in_version_order(self, calendar):
+        """Supplementals put out of order are stored in version order"""
+        for version, day in ((Version.B, 3), (Version.ORIGINAL, 1), (Version.C, 4), (Version.A, 2)):
+            calendar.put_supplemental(_supplemental(version, day))
+        assert list(calendar.get_supplemental_map()) == [Version.ORIGINAL, Version.A, Version.B, Version.C]
+
+    def test_map_ordered_on_construction_and_assignment(self):
+        """Maps passed in at construction or through the setter are put in version order"""
+        unordered = {Version.B: _supplemental(Version.B, 3), Version.A: _supplemental(Version.A, 2)}
+        calendar = Calendar(calendar_id=CalendarId(year=2023, cal_no=10), session_year=2023,
+                            supplemental_map=unordered)
+        assert list(calendar.supplemental_map) == [Version.A, Version.B]
+        calendar.set_supplemental_map({Version.C: _supplemental(Version.C, 9),
+                                       Version.ORIGINAL: _supplemental(Version.ORIGINAL, 1)})
+        assert list(calendar.supplemental_map) == [Version.ORIGINAL, Version.C]
+
+    def test_set_supplemental_map_leaves_argument_unchanged(self, calendar):
+        """The setter stores a sorted copy and does not reorder the caller's dict"""
+        unordered = {Version.C: _supplemental(Version.C, 9), Version.ORIGINAL: _supplemental(Version.ORIGINAL, 1)}
+        snapshot = list(unordered.items())
+        calendar.set_supplemental_map(unordered)
+        assert list(unordered.items()) == snapshot
+        assert calendar.supplemental_map is not unordered
+        assert list(calendar.supplemental_map) == [Version.ORIGINAL, Version.C]
+
+    def test_cal_date_follows_supplemental_map_assignment(self, calendar):
+        """Replacing the supplemental map is reflected in the calendar date"""
+        calendar.put_supplemental(_supplemental(Version.ORIGINAL, 1))
+        calendar.set_supplemental_map({Version.C: _supplemental(Version.C, 9)})
+        assert calendar.get_cal_date() == date(2023, 3, 9)
+
+    def test_cal_date_falls_back_to_active_lists(self, calendar):
+        """Without supplementals the first active list supplies the date"""
+        assert calendar.get_cal_date() is None
+        calendar.put_active_list(CalendarActiveList(sequence_no=0, cal_date=date(2023, 4, 1)))
+        assert calendar.get_cal_date() == date(2023, 4, 1)
+
+    def test_entry_list_ids_cover_supplementals_and_active_lists(self, calendar):
+        """One entry list id is produced per supplemental and active list"""
+        calendar.put_supplemental(_supplemental(Version.B, 3))
+        calendar.put_supplemental(_supplemental(Version.ORIGINAL, 1))
+        calendar.put_active_list(CalendarActiveList(sequence_no=0))
+        assert len(calendar.get_calendar_entry_list_ids()) == 3
+
+
+class TestCalendarHash:
+    """Tests for Calendar equality and hashing"""
+
+    def test_equal_calendars_hash_alike(self):
+        """Calendars with the same contents hash the same, whatever the insertion order"""
+        a = Calendar(calendar_id=CalendarId(year=2023, cal_no=10), session_year=2023)
+        b = Calendar(calendar_id=CalendarId(year=2023, cal_no=10), session_year=2023)
+        a.put_supplemental(_supplemental(Version.ORIGINAL, 1))
+        a.put_supplemental(_supplemental(Version.A, 2))
+        b.put_supplemental(_supplemental(Version.A, 2))
+        b.put_supplemental(_supplemental(Version.ORIGINAL, 1))
+        for calendar in (a, b):
+            calendar.put_active_list(CalendarActiveList(sequence_no=0))
+        assert a == b
+        assert hash(a) == hash(b)
+
+    def test_hash_follows_in_place_edits(self):
+        """Adding an active list after hashing changes the hash, as it changes equality"""
+        calendar = Calendar(calendar_id=CalendarId(year=2023, cal_no=10), session_year=2023)
+        before = hash(calendar)
+        calendar.put_active_list(CalendarActiveList(sequence_no=0))
+        assert hash(calendar) != before
+
+    def test_hash_covers_id_and_publish_time(self):
+        """Calendars with different ids or publish times hash differently"""
+        a = Calendar(calendar_id=CalendarId(year=2023, cal_no=10), session_year=2023)
+        b = Calendar(calendar_id=CalendarId(year=2023, cal_no=11), session_year=2023)
+        c = Calendar(calendar_id=CalendarId(year=2023, cal_no=10), session_year=2023,
+                     published_date_time=datetime(2023, 3, 1, 12))
+        assert len({hash(a), hash(b), hash(c)}) == 3
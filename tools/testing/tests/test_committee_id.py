@@ -0,0 +1,146 @@
+# tools/testing/tests/test_committee_id.py
+import dataclasses
+from datetime import datetime
+
+import pytest
+
+from models.agenda_id import AgendaId
+from models.chamber import Chamber
+from models.committee_agenda_addendum_id import CommitteeAgendaAddendumId
+from models.committee_agenda_id import CommitteeAgendaId
+from models.committee_id import CommitteeId
+from models.committee_session_id import CommitteeSessionId
+from models.committee_version_id import CommitteeVersionId
+from models.session_year import SessionYear
+from models.version import Version
+
+
+class TestCommitteeIdDataclass:
+    """Tests for the frozen committee id dataclasses"""
+
+    def test_positional_and_keyword_construction(self):
+        """Ids can be built positionally or by keyword"""
+        assert CommitteeId(Chamber.SENATE, "Finance") == CommitteeId(chamber=Chamber.SENATE, name="Finance")
+        session_id = CommitteeSessionId(Chamber.SENATE, "Finance", SessionYear.of(2023))
+        assert session_id.get_session() is SessionYear.of(2023)
+
+    def test_name_is_stripped(self):
+        """Surrounding whitespace is dropped from the name"""
+        committee_id = CommitteeId(Chamber.SENATE, "  Finance ")
+        assert committee_id.name == "Finance"
+        assert str(committee_id) == "Chamber.SENATE-Finance"
+
+    def test_invalid_values_rejected(self):
+        """Missing or blank names and chambers are rejected"""
+        with pytest.raises(ValueError):
+            CommitteeId(Chamber.SENATE, "  ")
+        with pytest.raises(ValueError):
+            CommitteeId(Chamber.SENATE, None)
+        with pytest.raises(ValueError):
+            CommitteeId(None, "Finance")
+        with pytest.raises(ValueError):
+            CommitteeVersionId(Chamber.SENATE, "Finance", SessionYear.of(2023))
+
+    def test_frozen(self):
+        """Ids cannot be modified after construction"""
+        committee_id = CommitteeId(Chamber.SENATE, "Finance")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            committee_id.name = "Rules"
+
+    def test_names_compare_case_insensitively(self):
+        """Names differing only in case are equal and hash alike"""
+        upper = CommitteeId(Chamber.SENATE, "FINANCE")
+        lower = CommitteeId(Chamber.SENATE, "finance")
+        assert upper == lower
+        assert hash(upper) == hash(lower)
+        assert upper != CommitteeId(Chamber.ASSEMBLY, "Finance")
+
+    def test_subclass_equality_includes_own_fields(self):
+        """Session and version ids also compare their own fields"""
+        when = datetime(2023, 1, 5)
+        a = CommitteeVersionId(Chamber.SENATE, "Finance", SessionYear.of(2023), when)
+        assert a == CommitteeVersionId(Chamber.SENATE, "finance", SessionYear.of(2023), when)
+        assert hash(a) == hash(CommitteeVersionId(Chamber.SENATE, "finance", SessionYear.of(2023), when))
+        assert a != CommitteeVersionId(Chamber.SENATE, "Finance", SessionYear.of(2023), datetime(2023, 2, 1))
+        assert CommitteeSessionId(Chamber.SENATE, "Finance", SessionYear.of(2023)) != \
+            CommitteeSessionId(Chamber.SENATE, "Finance", SessionYear.of(2021))
+
+    def test_usable_as_keys(self):
+        """Ids key dicts and sets"""
+        ids = {CommitteeId(Chamber.SENATE, "Finance"), CommitteeId(Chamber.SENATE, "finance"),
+               CommitteeId(Chamber.SENATE, "Rules")}
+        assert len(ids) == 2
+
+
+class TestCommitteeIdKey:
+    """Tests for the JSON map key form"""
+
+    def test_key_round_trip(self):
+        """from_key reads back what to_key writes, including hyphenated names"""
+        committee_id = CommitteeId(Chamber.ASSEMBLY, "Ways and Means - Sub")
+        assert committee_id.to_key() == "ASSEMBLY-Ways and Means - Sub"
+        assert CommitteeId.from_key(committee_id.to_key()) == committee_id
+
+    def test_invalid_chamber_key(self):
+        """A key without a known chamber is rejected"""
+        with pytest.raises(ValueError):
+            CommitteeId.from_key("Finance")
+
+
+class TestCommitteeIdOrdering:
+    """Tests for ordering by the cached sort key"""
+
+    def test_orders_by_chamber_then_name(self):
+        """Chamber names sort first, then the case-folded committee name"""
+        ids = [CommitteeId(Chamber.SENATE, "rules"), CommitteeId(Chamber.ASSEMBLY, "Ways"),
+               CommitteeId(Chamber.SENATE, "Finance"), CommitteeId(Chamber.ASSEMBLY, "codes")]
+        assert [str(committee_id) for committee_id in sorted(ids)] == [
+            "Chamber.ASSEMBLY-codes", "Chamber.ASSEMBLY-Ways", "Chamber.SENATE-Finance", "Chamber.SENATE-rules"]
+
+    def test_operators_agree_with_equality(self):
+        """Equal ids are neither less nor greater than each other"""
+        a = CommitteeId(Chamber.SENATE, "Finance")
+        b = CommitteeId(Chamber.SENATE, "FINANCE")
+        assert a <= b and a >= b
+        assert not a < b and not a > b
+
+    def test_session_ids_order_by_session(self):
+        """Session ids with the same committee sort by session year"""
+        later = CommitteeSessionId(Chamber.SENATE, "Finance", SessionYear.of(2023))
+        earlier = CommitteeSessionId(Chamber.SENATE, "Finance", SessionYear.of(2021))
+        assert earlier < later and later > earlier
+
+    def test_version_ids_order_by_reference_date(self):
+        """Version ids with the same session sort by reference date"""
+        session = SessionYear.of(2023)
+        first = CommitteeVersionId(Chamber.SENATE, "Finance", session, datetime(2023, 1, 1))
+        second = CommitteeVersionId(Chamber.SENATE, "Finance", session, datetime(2023, 6, 1))
+        assert sorted([second, first]) == [first, second]
+
+    def test_comparing_with_other_types_is_unsupported(self):
+        """Ordering against a non-id raises TypeError"""
+        with pytest.raises(TypeError):
+            CommitteeId(Chamber.SENATE, "Finance") < "Finance"
+
+
+class TestCommitteeAgendaIdOrdering:
+    """Tests for ordering committee agenda ids with and without an addendum"""
+
+    def test_mixed_ids_sort(self):
+        """Base and addendum ids sort together by agenda, committee, then addendum"""
+        agenda, earlier = AgendaId(year=2023, number=2), AgendaId(year=2023, number=1)
+        finance, rules = CommitteeId(Chamber.SENATE, "Finance"), CommitteeId(Chamber.SENATE, "Rules")
+        ids = [CommitteeAgendaAddendumId(agenda, rules, Version.A), CommitteeAgendaId(agenda, rules),
+               CommitteeAgendaAddendumId(agenda, finance, Version.ORIGINAL), CommitteeAgendaId(earlier, rules)]
+        assert sorted(ids) == [CommitteeAgendaId(earlier, rules),
+                               CommitteeAgendaAddendumId(agenda, finance, Version.ORIGINAL),
+                               CommitteeAgendaId(agenda, rules),
+                               CommitteeAgendaAddendumId(agenda, rules, Version.A)]
+
+    def test_operators_across_classes(self):
+        """A base id sorts before an addendum id for the same agenda and committee"""
+        base = CommitteeAgendaId(AgendaId(year=2023, number=1), CommitteeId(Chamber.SENATE, "Finance"))
+        addendum = CommitteeAgendaAddendumId(base.agenda_id, base.committee_id, Version.ORIGINAL)
+        assert base < addendum and base <= addendum
+        assert addendum > base and addendum >= base
+        assert base != addendum
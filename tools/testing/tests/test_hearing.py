@@ -0,0 +1,55 @@
+# tools/testing/tests/test_hearing.py
+from datetime import date
+
+from models.hearing import Hearing, HearingHost, HearingHostType, HearingId
+
+
+def _hearing(**overrides):
+    fields = dict(id=HearingId(id=7), filename="hearing.txt", text="Transcript text", title="Budget",
+                  address="Albany", date=date(2023, 2, 1), session_year=2023)
+    fields.update(overrides)
+    return Hearing(**fields)
+
+
+class TestHearingHash:
+    """Tests for Hearing equality and hashing"""
+
+    def test_equal_hearings_hash_alike(self):
+        """Hearings with the same fields are equal and hash the same"""
+        a, b = _hearing(), _hearing()
+        assert a == b
+        assert hash(a) == hash(b)
+        assert len({a, b}) == 1
+
+    def test_hash_ignores_text(self):
+        """The text takes part in equality but not in the hash"""
+        a, b = _hearing(), _hearing(text="Other text")
+        assert a != b
+        assert hash(a) == hash(b)
+
+    def test_hash_covers_id_and_filename(self):
+        """Hearings with a different id or filename hash differently"""
+        hashes = {hash(_hearing()), hash(_hearing(id=HearingId(id=8))), hash(_hearing(filename="other.txt"))}
+        assert len(hashes) == 3
+
+
+class TestHearingHostGetHosts:
+    """Tests for building hosts from a raw host block"""
+
+    def test_hosts_split_and_standardized(self):
+        """Each semicolon-separated name becomes a host with a standardized name"""
+        hosts = HearingHost.get_hosts("committee", "Finance;  Cities &  Towns", "SENATE")
+        assert [(host.chamber, host.type, host.name) for host in hosts] == [
+            ("SENATE", HearingHostType.COMMITTEE, "FINANCE"),
+            ("SENATE", HearingHostType.COMMITTEE, "CITIES AND TOWNS")]
+
+    def test_hosts_built_without_validation_match_validated_hosts(self):
+        """Hosts from model_construct equal hosts built through validation"""
+        (host,) = HearingHost.get_hosts("Task Force", "Aging", "ASSEMBLY")
+        assert host == HearingHost(chamber="ASSEMBLY", type=HearingHostType.TASK_FORCE, name="AGING")
+        assert host.model_fields_set == {"chamber", "type", "name"}
+
+    def test_joint_hosts_cover_both_chambers(self):
+        """A host block without a chamber yields hosts in both chambers"""
+        hosts = HearingHost.get_hosts("committee", "Finance", None)
+        assert [host.chamber for host in hosts] == ["SENATE", "ASSEMBLY"]
@@ -0,0 +1,81 @@
+# tools/testing/tests/test_lookup_tables.py
+import pytest
+
+from models.bill_type import BillType
+from models.chamber import Chamber
+from models.committee_member_title import CommitteeMemberTitle
+from models.hearing import HearingHostType
+
+
+class TestChamber:
+    """Tests for the Chamber lookups"""
+
+    def test_get_value_accepts_abbreviation_and_name(self):
+        """Both the abbreviation and the full name map to the chamber"""
+        assert Chamber.get_value("S") is Chamber.SENATE
+        assert Chamber.get_value(" assembly ") is Chamber.ASSEMBLY
+        assert Chamber.get_value("a") is Chamber.ASSEMBLY
+
+    def test_get_value_rejects_unknown(self):
+        """Unknown and missing values raise ValueError"""
+        with pytest.raises(ValueError):
+            Chamber.get_value("X")
+        with pytest.raises(ValueError):
+            Chamber.get_value(None)
+
+    def test_opposite(self):
+        """Each chamber's opposite is the other chamber"""
+        assert Chamber.SENATE.opposite() is Chamber.ASSEMBLY
+        assert Chamber.ASSEMBLY.opposite() is Chamber.SENATE
+
+
+class TestHearingHostType:
+    """Tests for the HearingHostType lookup"""
+
+    def test_to_type(self):
+        """Host type labels map to members regardless of spacing and case"""
+        assert HearingHostType.to_type("committee") is HearingHostType.COMMITTEE
+        assert HearingHostType.to_type(" Task Force ") is HearingHostType.TASK_FORCE
+        assert HearingHostType.to_type("WHOLE CHAMBER") is HearingHostType.WHOLE_CHAMBER
+        assert HearingHostType.to_type("legislative_commission") is HearingHostType.LEGISLATIVE_COMMISSION
+
+    def test_to_type_covers_every_member(self):
+        """Every member is reachable from its own value"""
+        for host_type in HearingHostType:
+            assert HearingHostType.to_type(host_type.value) is host_type
+
+    def test_to_type_rejects_unknown(self):
+        """Unknown labels raise ValueError"""
+        with pytest.raises(ValueError):
+            HearingHostType.to_type("caucus")
+
+
+class TestCommitteeMemberTitle:
+    """Tests for the CommitteeMemberTitle SQL enum lookup"""
+
+    def test_value_of_sql_enum(self):
+        """Lower-case SQL enum values map back to their titles"""
+        assert CommitteeMemberTitle.value_of_sql_enum("chair_person") is CommitteeMemberTitle.CHAIR_PERSON
+        for title in CommitteeMemberTitle:
+            assert CommitteeMemberTitle.value_of_sql_enum(title.as_sql_enum()) is title
+
+    def test_value_of_sql_enum_rejects_unknown(self):
+        """Unknown values raise ValueError"""
+        with pytest.raises(ValueError):
+            CommitteeMemberTitle.value_of_sql_enum("secretary")
+
+
+class TestBillType:
+    """Tests for the BillType value lookup"""
+
+    def test_from_value(self):
+        """Every bill type is reachable from its value, ignoring case and spaces"""
+        for bill_type in BillType:
+            assert BillType.from_value(f" {bill_type.value.lower()} ") is bill_type
+
+    def test_from_value_rejects_unknown(self):
+        """Unknown and missing values raise ValueError"""
+        with pytest.raises(ValueError):
+            BillType.from_value("Z")
+        with pytest.raises(ValueError):
+            BillType.from_value(None)
@@ -0,0 +1,61 @@
+# tools/testing/tests/test_transcript_models.py
+from datetime import date, datetime
+
+import pytest
+
+from models.transcript import (DayType, Hearing, HearingHost, HearingHostType, HearingId, SessionType,
+                               Transcript, TranscriptId)
+
+
+class TestTranscript:
+    """Smoke tests for the transcript models"""
+
+    def test_day_type_from_text(self):
+        """Two speakers make a legislative day, more make a session day"""
+        assert DayType.from_text("10:02 SECRETARY: Roll call\nPRESIDENT: Thank you") == DayType.LEGISLATIVE
+        assert DayType.from_text("SECRETARY: a\nPRESIDENT: b\nSENATOR SMITH: c") == DayType.SESSION
+        assert DayType.from_text("no speakers here") is None
+
+    def test_session_types_parse_and_sort(self):
+        """Regular sessions sort before extraordinary ones, which sort by numeral"""
+        types = [SessionType("EXTRAORDINARY SESSION II"), SessionType("REGULAR SESSION"),
+                 SessionType("EXTRAORDINARY SESSION I")]
+        assert [str(t) for t in sorted(types)] == [
+            "Regular Session", "Extraordinary Session I", "Extraordinary Session II"]
+        with pytest.raises(ValueError):
+            SessionType("SPECIAL SESSION")
+
+    def test_session_year_comes_from_id(self):
+        """A transcript without a session year takes it from its id, and equal transcripts hash alike"""
+        transcript_id = TranscriptId.from_datetime_and_type(datetime(2023, 1, 4, 11), "REGULAR SESSION")
+        transcript = Transcript(id=transcript_id, day_type=DayType.SESSION, filename="010423.txt")
+        assert transcript.session_year == 2023
+        assert hash(transcript) == hash(Transcript(id=transcript_id, day_type=DayType.SESSION,
+                                                   filename="010423.txt"))
+
+
+class TestTranscriptHearing:
+    """Smoke tests for the hearing models in models.transcript"""
+
+    def test_host_block_standardized(self):
+        """Committee labels and joint coalition hosts collapse to a single type"""
+        assert HearingHostType.standardize_host_block("STANDING SUBCOMMITTEES ON X") == "COMMITTEE ON X"
+        assert (HearingHostType.standardize_host_block("MAJORITY COALITION JOINT TASK FORCE ON Y")
+                == "TASK FORCE ON Y")
+
+    def test_get_hosts_for_joint_hearing(self):
+        """A hearing without a chamber gets each host once per chamber"""
+        hosts = HearingHost.get_hosts("COMMITTEE", "Finance; Rules", None)
+        assert [(host.chamber.value, host.name) for host in hosts] == [
+            ("SENATE", "FINANCE"), ("SENATE", "RULES"), ("ASSEMBLY", "FINANCE"), ("ASSEMBLY", "RULES")]
+        assert {host.type for host in hosts} == {HearingHostType.COMMITTEE}
+
+    def test_hearing_hash_uses_id_and_filename(self):
+        """Equal hearings hash alike; the session year comes from the hearing date"""
+        fields = dict(id=HearingId(id=1), filename="h.txt", title="t", address="a", date=date(2023, 2, 1),
+                      session_year=0)
+        a = Hearing(text="x", **fields)
+        b = Hearing(text="x", **fields)
+        assert a.session_year == 2023
+        assert a == b and hash(a) == hash(b)
+        assert a != Hearing(text="y", **fields)
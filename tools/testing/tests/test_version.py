@@ -0,0 +1,44 @@
+# tools/testing/tests/test_version.py
+import pytest
+
+from models.version import Version
+
+
+class TestVersion:
+    """Tests for Version parsing and ordering helpers"""
+
+    def test_of(self):
+        """Version strings parse case-insensitively, with blanks meaning the original"""
+        assert Version.of("a") is Version.A
+        assert Version.of(" B ") is Version.B
+        assert Version.of("") is Version.ORIGINAL
+        assert Version.of(None) is Version.ORIGINAL
+        assert Version.of("default") is Version.ORIGINAL
+
+    def test_of_rejects_unknown(self):
+        """Unknown version strings raise ValueError"""
+        with pytest.raises(ValueError):
+            Version.of("AA")
+
+    def test_before(self):
+        """before lists every earlier version in order"""
+        assert Version.before(Version.ORIGINAL) == []
+        assert Version.before(Version.C) == [Version.ORIGINAL, Version.A, Version.B]
+
+    def test_after(self):
+        """after lists every later version in order"""
+        assert Version.after(Version.Z) == []
+        assert Version.after(Version.X) == [Version.Y, Version.Z]
+        assert len(Version.after(Version.ORIGINAL)) == 26
+
+    def test_before_and_after_partition_versions(self):
+        """A version plus those before and after it covers every version once"""
+        for version in Version:
+            assert Version.before(version) + [version] + Version.after(version) == list(Version)
+
+    def test_results_are_independent_lists(self):
+        """Callers may modify the returned lists"""
+        Version.before(Version.C).clear()
+        Version.after(Version.X).append(Version.A)
+        assert Version.before(Version.C) == [Version.ORIGINAL, Version.A, Version.B]
+        assert Version.after(Version.X) == [Version.Y, Version.Z]